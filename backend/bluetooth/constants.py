@@ -5,6 +5,7 @@ Bluetooth constants and enumerations.
 from enum import Enum, auto
 from dataclasses import dataclass
 from typing import Optional
+import sys
 import time
 
 # Import config to use consistent UUIDs
@@ -53,6 +54,8 @@ class DeviceInfo:
     health_score: float = 1.0  # 0.0 to 1.0
     
     def __post_init__(self):
+        # Addresses key every device/connection map; share one string per address
+        self.address = sys.intern(self.address)
         if self.last_seen == 0.0:
             self.last_seen = time.time()
     
@@ -83,17 +86,19 @@ class DeviceInfo:
 
 class _UUIDDescriptor:
     """Descriptor for lazy UUID access from Config."""
-    def __init__(self, config_attr, fallback):
+    def __init__(self, config_attr, fallback, lower=False):
         self.config_attr = config_attr
         self.fallback = fallback
+        self.lower = lower
         self._value = None
     
     def __get__(self, obj, objtype=None):
         if self._value is None:
             if Config:
-                self._value = getattr(Config.bluetooth, self.config_attr)
+                value = getattr(Config.bluetooth, self.config_attr)
             else:
-                self._value = self.fallback
+                value = self.fallback
+            self._value = sys.intern(value.lower() if self.lower else value)
         return self._value
 
 
@@ -103,20 +108,28 @@ class BluetoothConstants:
     # Service UUIDs - automatically use Config values for consistency
     SERVICE_UUID = _UUIDDescriptor('SERVICE_UUID', "12345678-1234-5678-1234-56789abcdef0")
     CHARACTERISTIC_UUID = _UUIDDescriptor('CHARACTERISTIC_UUID', "12345678-1234-5678-1234-56789abcdef1")
+    # Lower-cased forms for matching against UUIDs reported by the stack
+    SERVICE_UUID_LOWER = _UUIDDescriptor('SERVICE_UUID', "12345678-1234-5678-1234-56789abcdef0", lower=True)
+    CHARACTERISTIC_UUID_LOWER = _UUIDDescriptor('CHARACTERISTIC_UUID', "12345678-1234-5678-1234-56789abcdef1", lower=True)
     
     # Protocol constants
     PROTOCOL_VERSION = 1
     HEADER_SIZE = 4  # bytes
     MAX_PACKET_SIZE = 512  # bytes
+    RX_BATCH_SIZE = 16  # Notifications drained per receive-consumer wakeup
+    RX_QUEUE_SIZE = 64  # Pending notifications per peer; oldest dropped when full
     
     # Timing constants (in seconds)
     DEFAULT_SCAN_TIMEOUT = 10.0
     DEFAULT_CONNECTION_TIMEOUT = 30.0
     DEFAULT_HEARTBEAT_INTERVAL = 15.0
+    CLEANUP_INTERVAL = 30.0  # Stale-connection sweep period
+    WRITE_TIMEOUT = 1.5  # Per GATT write; a stalled peer is dropped after this
     
     # Retry constants
     MAX_RETRY_ATTEMPTS = 3
     RETRY_BACKOFF_BASE = 2.0  # Exponential backoff base
+    MAX_CONSECUTIVE_SEND_FAILURES = 3  # Skip and disconnect peer after this many
     
     # Health score thresholds
     HEALTH_SCORE_CRITICAL = 0.2
@@ -14,6 +14,7 @@ import warnings
 import logging
 import sys
 from typing import Dict, List, Optional, Callable, Any, Set
+from collections import OrderedDict
 from enum import Enum, auto
 from dataclasses import dataclass
 from io import StringIO
@@ -123,8 +124,11 @@ class DeviceDiscovery:
         self._state = DiscoveryState.IDLE
         self._network_state = NetworkState.NO_DEVICES
         
-        # Device tracking - with proper deduplication
-        self._discovered_devices: Dict[str, DeviceInfo] = {}
+        # Device tracking - with proper deduplication. Ordered by last
+        # sighting so the cache can be capped in dense environments.
+        self._discovered_devices: "OrderedDict[str, DeviceInfo]" = OrderedDict()
+        self._max_devices = Config.bluetooth.MAX_DISCOVERED_DEVICES
+        self._service_uuid = BluetoothConstants.SERVICE_UUID_LOWER  # For advertisement filtering
         self._app_devices: Set[str] = set()  # Devices running our app
         self._device_lock = asyncio.Lock()
         
@@ -141,6 +145,8 @@ class DeviceDiscovery:
         
         # Scanner
         self._scanner: Optional[BleakScanner] = None
+        # Background stops still in flight, one per stopped scanner
+        self._scanner_stop_tasks: Set[asyncio.Task] = set()
         self._scan_task: Optional[asyncio.Task] = None
         self._running = False
         
@@ -191,11 +197,8 @@ class DeviceDiscovery:
             except asyncio.CancelledError:
                 pass
         
-        if self._scanner:
-            try:
-                await self._scanner.stop()
-            except Exception:
-                pass
+        await self.stop_scan_nowait()
+        await self._wait_scanner_stopped()
         
         logger.info("Device discovery stopped")
     
@@ -244,6 +247,7 @@ class DeviceDiscovery:
                 
                 if is_new_device:
                     self._discovered_devices[address] = device_info
+                    self._evict_oldest_devices()
                     logger.info(f"🆕 NEW DEVICE: {address} | {device_info.name or 'Unknown'} | RSSI: {device_info.rssi} | App: {is_app_device}")
                     new_devices_this_scan.append(device_info)
                     
@@ -262,6 +266,7 @@ class DeviceDiscovery:
                     existing = self._discovered_devices[address]
                     existing.rssi = device_info.rssi
                     existing.update_seen()
+                    self._discovered_devices.move_to_end(address)
                     
                     # Check if it became an app device
                     if is_app_device and address not in self._app_devices:
@@ -276,7 +281,11 @@ class DeviceDiscovery:
             
             logger.info(f"🔍 Starting BLE scan #{self._stats.total_scans} (timeout: {timeout}s)")
             
+            # A previous scan's stop may still be in flight
+            await self._wait_scanner_stopped()
+            
             scanner = BleakScanner(detection_callback=detection_callback)
+            self._scanner = scanner
             
             # Suppress known non-fatal dbus-fast KeyError during scan operations
             with StderrFilter():
@@ -286,18 +295,26 @@ class DeviceDiscovery:
                         timeout=Config.bluetooth.SCANNER_START_TIMEOUT
                     )
                     await asyncio.sleep(timeout)
-                    await asyncio.wait_for(
-                        scanner.stop(),
-                        timeout=Config.bluetooth.SCANNER_STOP_TIMEOUT
-                    )
+                except asyncio.CancelledError:
+                    self._schedule_scanner_stop(scanner)
+                    raise
                 except asyncio.TimeoutError:
                     logger.warning("Scanner operation timed out")
+                    if self._scanner is scanner:
+                        self._scanner = None
                     try:
                         await scanner.stop()
                     except Exception:
                         pass
                     raise BluetoothDiscoveryError("Scanner operation timed out")
             
+            # Don't block on the stop-complete event: the stack processes
+            # stop and connect commands in order, so callers can issue
+            # connects right away. The stop task filters stderr itself.
+            # Stop this scan's own scanner: an overlapping scan_once may
+            # have replaced self._scanner since.
+            self._schedule_scanner_stop(scanner)
+            
             # Log results
             unique_devices_seen = len(self._current_scan_devices)
             new_count = len(new_devices_this_scan)
@@ -329,6 +346,43 @@ class DeviceDiscovery:
         except Exception as e:
             raise BluetoothDiscoveryError(f"Unexpected scan error: {e}")
     
+    async def stop_scan_nowait(self) -> None:
+        """
+        Schedule the active scanner to stop and return immediately.
+        
+        The stop runs as a background task so the caller can start
+        connecting while the adapter finishes tearing down the scan.
+        """
+        if self._scanner is not None:
+            self._schedule_scanner_stop(self._scanner)
+    
+    def _schedule_scanner_stop(self, scanner: BleakScanner) -> None:
+        """Stop a scanner in the background, tracking the stop task."""
+        if self._scanner is scanner:
+            self._scanner = None
+        task = asyncio.create_task(self._stop_scanner(scanner))
+        self._scanner_stop_tasks.add(task)
+        task.add_done_callback(self._scanner_stop_tasks.discard)
+    
+    async def _stop_scanner(self, scanner: BleakScanner) -> None:
+        """Stop a scanner, logging (not raising) on failure."""
+        # Same non-fatal dbus-fast noise as during the scan itself
+        with StderrFilter():
+            try:
+                await asyncio.wait_for(
+                    scanner.stop(),
+                    timeout=Config.bluetooth.SCANNER_STOP_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Scanner stop timed out")
+            except Exception as e:
+                logger.debug(f"Scanner stop failed: {e}")
+    
+    async def _wait_scanner_stopped(self) -> None:
+        """Wait for all pending background scanner stops, if any."""
+        if self._scanner_stop_tasks:
+            await asyncio.gather(*self._scanner_stop_tasks)
+    
     def _is_app_device(self, device: BLEDevice, advertisement_data: AdvertisementData) -> bool:
         """
         Check if a device is running our app.
@@ -338,7 +392,7 @@ class DeviceDiscovery:
         if not advertisement_data.service_uuids:
             return False
         
-        target_uuid = BluetoothConstants.SERVICE_UUID.lower()
+        target_uuid = self._service_uuid
         for uuid in advertisement_data.service_uuids:
             if uuid.lower() == target_uuid:
                 return True
@@ -379,8 +433,7 @@ class DeviceDiscovery:
                 await asyncio.sleep(self._current_interval)
             except Exception as e:
                 logger.error(f"Unexpected error in scan loop: {e}")
-                import traceback
-                logger.debug(traceback.format_exc())
+                logger.debug("Scan loop traceback", exc_info=True)
                 await asyncio.sleep(self._current_interval)
     
     async def _update_network_state(self) -> None:
@@ -443,6 +496,17 @@ class DeviceDiscovery:
             if self._on_device_lost:
                 await self._safe_callback(self._on_device_lost, device)
     
+    def _evict_oldest_devices(self) -> None:
+        """
+        Drop least recently seen devices beyond the cache cap.
+        
+        Must be called with the device lock held.
+        """
+        while len(self._discovered_devices) > self._max_devices:
+            address, _ = self._discovered_devices.popitem(last=False)
+            self._app_devices.discard(address)
+            logger.debug(f"Evicted {address} from discovery cache")
+    
     async def get_app_devices(self) -> List[DeviceInfo]:
         """Get list of devices running our app."""
         async with self._device_lock:
@@ -137,8 +137,7 @@ class BLEGATTServer:
             
         except Exception as e:
             logger.error(f"Failed to start GATT server: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("GATT server start traceback", exc_info=True)
             return False
     
     async def stop(self) -> None:
@@ -50,7 +50,7 @@ _dbus_logger = logging.getLogger('dbus_fast')
 _dbus_logger.setLevel(logging.ERROR)
 
 
-@dataclass
+@dataclass(slots=True)
 class PeerConnection:
     """Represents a connection to a peer device."""
     device_info: DeviceInfo
@@ -60,6 +60,10 @@ class PeerConnection:
     bytes_received: int = 0
     messages_sent: int = 0
     messages_received: int = 0
+    consecutive_failures: int = 0
+    write_char: Optional[Any] = None  # Resolved write characteristic
+    rx_queue: Optional[asyncio.Queue] = None
+    rx_consumer: Optional[asyncio.Task] = None
 
 
 class BluetoothManager:
@@ -77,20 +81,24 @@ class BluetoothManager:
         # Single source of truth for connections
         self._connections: Dict[str, PeerConnection] = {}
         self._connection_lock = asyncio.Lock()
+        # Addresses of CONNECTED peers; rebuilt lazily after any change
+        self._connected_addresses_cache: List[str] = []
+        self._connected_cache_dirty = True
         
         # Device tracking
         self._discovered_devices: Dict[str, DeviceInfo] = {}
         self._device_lock = asyncio.Lock()
         
         # Callbacks
-        self._on_message_received: Optional[Callable[[str, dict], Any]] = None
+        self._on_message_received: Optional[Callable[[str, bytes], Any]] = None
         self._on_device_connected: Optional[Callable[[DeviceInfo], Any]] = None
         self._on_device_disconnected: Optional[Callable[[DeviceInfo], Any]] = None
         self._on_device_discovered: Optional[Callable[[DeviceInfo], Any]] = None
         
         # Background tasks
-        self._heartbeat_task: Optional[asyncio.Task] = None
-        self._cleanup_task: Optional[asyncio.Task] = None
+        self._periodic_task: Optional[asyncio.Task] = None
+        # Disconnects scheduled from the send path, one per address
+        self._pending_disconnects: Dict[str, asyncio.Task] = {}
         
         # Local device info
         self._local_address: Optional[str] = None
@@ -106,10 +114,10 @@ class BluetoothManager:
             return True
         
         try:
-            # Test if Bluetooth is available
-            scanner = BleakScanner()
-            await asyncio.wait_for(scanner.start(), timeout=5.0)
-            await scanner.stop()
+            # Cheap availability check: constructing the scanner resolves the
+            # platform backend without running a scan cycle. Adapter errors
+            # surface (as BleakError) on the first real scan or connect.
+            BleakScanner()
             
             # Generate a pseudo-local address
             import uuid
@@ -118,9 +126,7 @@ class BluetoothManager:
             self._initialized = True
             logger.info(f"Bluetooth manager initialized (local: {self._local_address})")
             return True
-            
-        except asyncio.TimeoutError:
-            raise BluetoothAdapterError("Bluetooth adapter initialization timed out")
+        
         except BleakError as e:
             raise BluetoothNotAvailableError(f"Bluetooth not available: {e}")
         except Exception as e:
@@ -137,8 +143,7 @@ class BluetoothManager:
         self._running = True
         
         # Start background tasks
-        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        self._periodic_task = asyncio.create_task(self._periodic_tick())
         
         logger.info("Bluetooth manager started")
     
@@ -147,13 +152,12 @@ class BluetoothManager:
         self._running = False
         
         # Cancel background tasks
-        for task in [self._heartbeat_task, self._cleanup_task]:
-            if task:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        if self._periodic_task:
+            self._periodic_task.cancel()
+            try:
+                await self._periodic_task
+            except asyncio.CancelledError:
+                pass
         
         # Disconnect all peers
         async with self._connection_lock:
@@ -175,8 +179,12 @@ class BluetoothManager:
     @property
     def connection_count(self) -> int:
         """Get the number of active connections."""
-        return len([c for c in self._connections.values() 
-                   if c.device_info.state == ConnectionState.CONNECTED])
+        return len(self.get_connected_addresses())
+    
+    def is_connected(self, address: str) -> bool:
+        """Check whether a device is currently connected."""
+        conn = self._connections.get(address)
+        return conn is not None and conn.device_info.state == ConnectionState.CONNECTED
     
     @property
     def available_slots(self) -> int:
@@ -216,6 +224,13 @@ class BluetoothManager:
             device_info.state = ConnectionState.CONNECTING
             device_info.connection_attempts += 1
         
+        # Shielded so that cancelling the caller (e.g. a scan task being torn
+        # down while its stop is still in flight) doesn't abort a connect
+        # halfway and leave an unregistered client behind.
+        return await asyncio.shield(self._establish_connection(address, device_info))
+    
+    async def _establish_connection(self, address: str, device_info: DeviceInfo) -> bool:
+        """Connect, subscribe and register a peer (called by connect_to_device)."""
         try:
             logger.info(f"🔌 Connecting to {address}...")
             
@@ -233,9 +248,10 @@ class BluetoothManager:
                 if not has_service:
                     logger.warning(f"⚠️ Device {address} doesn't have our service UUID")
                 
-                # Set up notifications
+                # Set up notifications (queued until the consumer starts)
+                rx_queue: asyncio.Queue = asyncio.Queue(maxsize=BluetoothConstants.RX_QUEUE_SIZE)
                 try:
-                    await self._setup_notifications(client, address)
+                    await self._setup_notifications(client, address, rx_queue)
                 except Exception as e:
                     logger.warning(f"Failed to setup notifications for {address}: {e}")
                 
@@ -243,11 +259,15 @@ class BluetoothManager:
                     device_info.state = ConnectionState.CONNECTED
                     device_info.update_heartbeat()
                     
-                    self._connections[address] = PeerConnection(
+                    conn = PeerConnection(
                         device_info=device_info,
                         client=client,
                         connected_at=time.time(),
+                        rx_queue=rx_queue,
                     )
+                    conn.rx_consumer = asyncio.create_task(self._rx_consumer(address, rx_queue))
+                    self._connections[address] = conn
+                    self._connected_cache_dirty = True
                 
                 # Set up disconnect callback
                 client.set_disconnected_callback(
@@ -302,6 +322,7 @@ class BluetoothManager:
         
         conn = self._connections[address]
         conn.device_info.state = ConnectionState.DISCONNECTING
+        self._connected_cache_dirty = True
         
         try:
             if conn.client and conn.client.is_connected:
@@ -310,6 +331,7 @@ class BluetoothManager:
             pass
         
         conn.device_info.state = ConnectionState.DISCONNECTED
+        self._stop_rx_consumer(conn)
         del self._connections[address]
         
         # Notify callback
@@ -326,21 +348,36 @@ class BluetoothManager:
                 conn = self._connections[address]
                 conn.device_info.state = ConnectionState.DISCONNECTED
                 conn.device_info.decrease_health(0.2)
+                self._connected_cache_dirty = True
                 
                 if self._on_device_disconnected:
                     await self._safe_callback(self._on_device_disconnected, conn.device_info)
                 
+                self._stop_rx_consumer(conn)
                 del self._connections[address]
         
         logger.info(f"Device {address} disconnected unexpectedly")
     
     # ==================== Data Transmission ====================
     
+    async def _get_services(self, client: BleakClient) -> Any:
+        """
+        Get a client's GATT services.
+        
+        Bleak resolves services during connect, so the cached collection
+        is used directly; only fall back to a fresh lookup if discovery
+        has not been performed on this connection.
+        """
+        try:
+            return client.services
+        except BleakError:
+            return await client.get_services()
+    
     async def _verify_service_uuid(self, client: BleakClient) -> bool:
         """Verify if a connected device has our service UUID."""
         try:
-            services = await client.get_services()
-            target_uuid = BluetoothConstants.SERVICE_UUID.lower()
+            services = await self._get_services(client)
+            target_uuid = BluetoothConstants.SERVICE_UUID_LOWER
             
             for service in services:
                 if target_uuid in str(service.uuid).lower():
@@ -350,16 +387,18 @@ class BluetoothManager:
             logger.warning(f"Error verifying service UUID: {e}")
             return True  # Assume OK if we can't verify
     
-    async def _setup_notifications(self, client: BleakClient, address: str) -> None:
-        """Set up notification subscription for receiving messages."""
+    async def _setup_notifications(
+        self, client: BleakClient, address: str, rx_queue: asyncio.Queue
+    ) -> None:
+        """Set up notification subscription feeding the peer's receive queue."""
         try:
-            services = await client.get_services()
+            services = await self._get_services(client)
             target_char = None
             
             for service in services:
-                if BluetoothConstants.SERVICE_UUID.lower() in str(service.uuid).lower():
+                if BluetoothConstants.SERVICE_UUID_LOWER in str(service.uuid).lower():
                     for char in service.characteristics:
-                        if BluetoothConstants.CHARACTERISTIC_UUID.lower() in str(char.uuid).lower():
+                        if BluetoothConstants.CHARACTERISTIC_UUID_LOWER in str(char.uuid).lower():
                             if "notify" in char.properties or "indicate" in char.properties:
                                 target_char = char
                                 break
@@ -370,11 +409,10 @@ class BluetoothManager:
                 logger.debug(f"No notification characteristic found on {address}")
                 return
             
+            # Enqueue only; parsing happens in the per-peer _rx_consumer task
             await client.start_notify(
                 target_char.uuid,
-                lambda sender, data: asyncio.create_task(
-                    self._notification_handler(address, data)
-                )
+                lambda sender, data: self._enqueue_notification(address, rx_queue, data)
             )
             
             logger.info(f"Subscribed to notifications on {address}")
@@ -382,28 +420,57 @@ class BluetoothManager:
         except Exception as e:
             logger.warning(f"Could not setup notifications for {address}: {e}")
     
-    async def _notification_handler(self, address: str, data: bytes) -> None:
-        """Handle incoming BLE notification."""
-        try:
-            async with self._connection_lock:
-                if address in self._connections:
-                    conn = self._connections[address]
-                    conn.bytes_received += len(data)
-                    conn.messages_received += 1
-                    conn.device_info.update_heartbeat()
-            
-            # Parse message
+    @staticmethod
+    def _enqueue_notification(address: str, rx_queue: asyncio.Queue, data: bytes) -> None:
+        """Queue a notification, dropping the oldest if the consumer lags."""
+        if rx_queue.full():
+            rx_queue.get_nowait()
+            logger.warning(f"Receive queue for {address} full, dropping oldest notification")
+        rx_queue.put_nowait(data)
+    
+    async def _rx_consumer(self, address: str, rx_queue: asyncio.Queue) -> None:
+        """
+        Drain a peer's notification queue in batches.
+        
+        Waits for one packet, then takes whatever else is already queued
+        (up to RX_BATCH_SIZE) so counters are updated under a single lock
+        acquisition per batch rather than per packet.
+        """
+        while True:
             try:
-                message_dict = json.loads(data.decode('utf-8'))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                if isinstance(data, dict):
-                    message_dict = data
-                else:
-                    logger.warning(f"Failed to parse message from {address}")
-                    return
+                batch = [await rx_queue.get()]
+                while len(batch) < BluetoothConstants.RX_BATCH_SIZE and not rx_queue.empty():
+                    batch.append(rx_queue.get_nowait())
+                
+                async with self._connection_lock:
+                    conn = self._connections.get(address)
+                    if conn:
+                        conn.bytes_received += sum(len(data) for data in batch)
+                        conn.messages_received += len(batch)
+                        conn.device_info.update_heartbeat()
+                
+                for data in batch:
+                    await self._notification_handler(address, data)
             
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error draining notifications from {address}: {e}")
+    
+    def _stop_rx_consumer(self, conn: PeerConnection) -> None:
+        """Cancel a peer's receive consumer task."""
+        task = conn.rx_consumer
+        if task and task is not asyncio.current_task():
+            task.cancel()
+        conn.rx_consumer = None
+    
+    async def _notification_handler(self, address: str, data: bytes) -> None:
+        """Dispatch a single incoming BLE notification."""
+        try:
+            # Hand the raw payload on; the message handler parses and
+            # validates it, so decoding here would only be re-encoded
             if self._on_message_received:
-                await self._safe_callback(self._on_message_received, address, message_dict)
+                await self._safe_callback(self._on_message_received, address, bytes(data))
                 
         except Exception as e:
             logger.error(f"Error handling notification from {address}: {e}")
@@ -430,45 +497,85 @@ class BluetoothManager:
                 return False
         
         try:
-            services = await conn.client.get_services()
-            target_char = None
+            target_char = conn.write_char
+            if target_char is None:
+                target_char = await self._find_write_characteristic(conn.client)
+                if not target_char:
+                    logger.warning(f"No write characteristic found on {address}")
+                    return False
+                conn.write_char = target_char
             
-            for service in services:
-                if BluetoothConstants.SERVICE_UUID.lower() in str(service.uuid).lower():
-                    for char in service.characteristics:
-                        if BluetoothConstants.CHARACTERISTIC_UUID.lower() in str(char.uuid).lower():
-                            if "write" in char.properties or "write-without-response" in char.properties:
-                                target_char = char
-                                break
-                    if target_char:
-                        break
-            
-            if not target_char:
-                logger.warning(f"No write characteristic found on {address}")
+            # The peer may have dropped since the check above; fail fast
+            # rather than waiting out the stack's "not connected" timeout.
+            if not conn.client.is_connected:
+                logger.debug(f"Cannot send to {address}: disconnected before write")
+                await self._record_send_failure(address, conn)
                 return False
             
             use_response = "write-without-response" not in target_char.properties
             
-            await conn.client.write_gatt_char(
-                target_char.uuid,
-                data,
-                response=use_response
+            await asyncio.wait_for(
+                conn.client.write_gatt_char(
+                    target_char.uuid,
+                    data,
+                    response=use_response
+                ),
+                timeout=BluetoothConstants.WRITE_TIMEOUT
             )
             
             async with self._connection_lock:
                 conn.bytes_sent += len(data)
                 conn.messages_sent += 1
+                conn.consecutive_failures = 0
             
             logger.debug(f"Sent {len(data)} bytes to {address}")
             return True
             
+        except asyncio.TimeoutError:
+            logger.warning(f"Write to {address} timed out, dropping peer")
+            await self._record_send_failure(address, conn)
+            self._schedule_disconnect(address)
+            return False
         except Exception as e:
             logger.warning(f"Error sending data to {address}: {e}")
-            async with self._connection_lock:
-                if address in self._connections:
-                    self._connections[address].device_info.decrease_health(0.1)
+            await self._record_send_failure(address, conn)
             return False
     
+    async def _find_write_characteristic(self, client: BleakClient) -> Optional[Any]:
+        """Find our writable message characteristic on a connected client."""
+        services = await self._get_services(client)
+        
+        for service in services:
+            if BluetoothConstants.SERVICE_UUID_LOWER in str(service.uuid).lower():
+                for char in service.characteristics:
+                    if BluetoothConstants.CHARACTERISTIC_UUID_LOWER in str(char.uuid).lower():
+                        if "write" in char.properties or "write-without-response" in char.properties:
+                            return char
+        return None
+    
+    def _schedule_disconnect(self, address: str) -> None:
+        """Disconnect a peer in the background unless already pending."""
+        if address in self._pending_disconnects:
+            return
+        task = asyncio.create_task(self.disconnect_device(address))
+        self._pending_disconnects[address] = task
+        task.add_done_callback(lambda t: self._pending_disconnects.pop(address, None))
+    
+    async def _record_send_failure(self, address: str, conn: PeerConnection) -> None:
+        """Count a failed send against a peer's health, dropping it if it keeps failing."""
+        async with self._connection_lock:
+            # Skip if the peer reconnected and conn is a stale entry
+            if self._connections.get(address) is not conn:
+                return
+            conn.consecutive_failures += 1
+            conn.device_info.decrease_health(0.1)
+            failing = conn.consecutive_failures >= BluetoothConstants.MAX_CONSECUTIVE_SEND_FAILURES
+        
+        if failing:
+            # Health alone decays too slowly for the stale sweep to reap it
+            logger.warning(f"{address} failed {conn.consecutive_failures} sends in a row, dropping peer")
+            self._schedule_disconnect(address)
+    
     async def send_message(self, address: str, message: dict) -> bool:
         """Send a JSON message to a connected device."""
         try:
@@ -479,21 +586,38 @@ class BluetoothManager:
     
     async def broadcast_message(self, message: dict, exclude: List[str] = None) -> int:
         """Broadcast a message to all connected devices."""
-        exclude = exclude or []
         success_count = 0
         
+        for address in await self._broadcast_targets(exclude):
+            if await self.send_message(address, message):
+                success_count += 1
+        
+        return success_count
+    
+    async def _broadcast_data(self, data: bytes, exclude: List[str] = None) -> int:
+        """Broadcast pre-encoded bytes to all connected devices."""
+        success_count = 0
+        
+        for address in await self._broadcast_targets(exclude):
+            if await self.send_data(address, data):
+                success_count += 1
+        
+        return success_count
+    
+    async def _broadcast_targets(self, exclude: List[str] = None) -> List[str]:
+        """Get addresses of connected peers eligible for a broadcast."""
+        exclude = exclude or []
+        
         async with self._connection_lock:
-            addresses = [
+            # Peers whose recent writes keep failing are skipped; they would
+            # only stall the broadcast behind write timeouts until their
+            # scheduled disconnect completes.
+            return [
                 addr for addr, conn in self._connections.items()
                 if conn.device_info.state == ConnectionState.CONNECTED
+                and conn.consecutive_failures < BluetoothConstants.MAX_CONSECUTIVE_SEND_FAILURES
                 and addr not in exclude
             ]
-        
-        for address in addresses:
-            if await self.send_message(address, message):
-                success_count += 1
-        
-        return success_count
     
     # ==================== Status & Info ====================
     
@@ -506,6 +630,21 @@ class BluetoothManager:
                 if conn.device_info.state == ConnectionState.CONNECTED
             ]
     
+    def get_connected_addresses(self) -> List[str]:
+        """
+        Get addresses of currently connected devices.
+        
+        Cached between connection changes, so this is cheap enough to call
+        per message. The returned list is shared and must not be modified.
+        """
+        if self._connected_cache_dirty:
+            self._connected_addresses_cache = [
+                addr for addr, conn in self._connections.items()
+                if conn.device_info.state == ConnectionState.CONNECTED
+            ]
+            self._connected_cache_dirty = False
+        return self._connected_addresses_cache
+    
     async def get_all_devices(self) -> List[DeviceInfo]:
         """Get list of all known devices."""
         async with self._device_lock:
@@ -538,7 +677,7 @@ class BluetoothManager:
     
     # ==================== Callbacks ====================
     
-    def set_message_callback(self, callback: Callable[[str, dict], Any]) -> None:
+    def set_message_callback(self, callback: Callable[[str, bytes], Any]) -> None:
         """Set callback for received messages."""
         self._on_message_received = callback
     
@@ -565,50 +704,61 @@ class BluetoothManager:
     
     # ==================== Background Tasks ====================
     
-    async def _heartbeat_loop(self) -> None:
-        """Background task to send heartbeats."""
+    async def _periodic_tick(self) -> None:
+        """
+        Background task driving heartbeats and stale-connection cleanup.
+        
+        Heartbeats go out every HEARTBEAT_INTERVAL; the cleanup sweep runs
+        on every Nth tick so it shares the same wakeup. Ticks are scheduled
+        on the monotonic clock so wall-clock jumps don't skew the period.
+        """
+        interval = float(Config.bluetooth.HEARTBEAT_INTERVAL)
+        cleanup_every = max(1, round(BluetoothConstants.CLEANUP_INTERVAL / interval))
+        
+        # Only the timestamp changes between heartbeats, so encode the
+        # constant part once and splice the timestamp in as a float repr
+        # (what json.dumps emits for floats).
+        heartbeat_prefix = json.dumps({
+            "type": MessageType.HEARTBEAT.value,
+            "sender_id": self._local_address,
+        })[:-1].encode("utf-8") + b', "timestamp": '
+        
+        tick = 0
+        next_tick = time.monotonic() + interval
+        
         while self._running:
             try:
-                await asyncio.sleep(Config.bluetooth.HEARTBEAT_INTERVAL)
+                await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+                next_tick += interval
+                tick += 1
                 
-                heartbeat_message = {
-                    "type": MessageType.HEARTBEAT.value,
-                    "timestamp": time.time(),
-                    "sender_id": self._local_address,
-                }
-                
-                await self.broadcast_message(heartbeat_message)
+                heartbeat_data = heartbeat_prefix + repr(time.time()).encode("ascii") + b"}"
+                await self._broadcast_data(heartbeat_data)
                 
+                if tick % cleanup_every == 0:
+                    await self._cleanup_stale_connections()
+            
             except asyncio.CancelledError:
                 break
             except Exception:
                 pass
     
-    async def _cleanup_loop(self) -> None:
-        """Background task to cleanup stale connections."""
-        while self._running:
-            try:
-                await asyncio.sleep(30)
-                
-                current_time = time.time()
-                stale_addresses = []
-                
-                async with self._connection_lock:
-                    for address, conn in self._connections.items():
-                        if conn.device_info.last_heartbeat > 0:
-                            time_since_heartbeat = current_time - conn.device_info.last_heartbeat
-                            if time_since_heartbeat > Config.bluetooth.HEARTBEAT_TIMEOUT:
-                                stale_addresses.append(address)
-                                conn.device_info.decrease_health(0.3)
-                        
-                        if conn.device_info.health_score < BluetoothConstants.HEALTH_SCORE_CRITICAL:
-                            stale_addresses.append(address)
-                
-                for address in set(stale_addresses):
-                    logger.info(f"Removing stale connection: {address}")
-                    await self.disconnect_device(address)
+    async def _cleanup_stale_connections(self) -> None:
+        """Disconnect peers that missed heartbeats or fell below critical health."""
+        current_time = time.time()
+        stale_addresses = []
+        
+        async with self._connection_lock:
+            for address, conn in self._connections.items():
+                if conn.device_info.last_heartbeat > 0:
+                    time_since_heartbeat = current_time - conn.device_info.last_heartbeat
+                    if time_since_heartbeat > Config.bluetooth.HEARTBEAT_TIMEOUT:
+                        stale_addresses.append(address)
+                        conn.device_info.decrease_health(0.3)
                 
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                pass
+                if conn.device_info.health_score < BluetoothConstants.HEALTH_SCORE_CRITICAL:
+                    stale_addresses.append(address)
+        
+        for address in set(stale_addresses):
+            logger.info(f"Removing stale connection: {address}")
+            await self.disconnect_device(address)
@@ -24,14 +24,64 @@ class CommandType(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Command:
     """Parsed command with arguments."""
     type: CommandType
-    args: List[str]
+    args: Tuple[str, ...]
     raw: str
 
 
+# Built once at import; get_help_text() returns this same string.
+_HELP_TEXT = """
+Available Commands:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+  send <message>      Broadcast a message to the mesh network
+                      Aliases: s
+                      Flow: Type your message and send to all peers.
+
+  list                Show connected and discovered app devices
+                      Aliases: ls, devices
+                      Flow: See who is connected and who is discoverable.
+
+  scan                Force an immediate device scan
+                      Aliases: discover
+                      Flow: Use when a new laptop joins and you want it
+                            to appear quickly.
+
+  connect <address>   Connect to a device by address
+                      Aliases: c
+                      Flow: Manually connect when auto-connect fails.
+
+  disconnect <addr>   Disconnect from a device
+                      Aliases: dc
+
+  status              Show live system + discovery status
+                      Aliases: st
+                      Flow: Your main dashboard. Shows Bluetooth state,
+                            GATT server, discovery stats and scan interval.
+
+  stats               Show message statistics
+                      Aliases: statistics
+
+  clear               Clear the screen
+                      Aliases: cls
+
+  help                Show this help message
+                      Aliases: h, ?
+
+  quit                Exit the application
+                      Aliases: exit, q
+
+Tip: Typical flow
+  1) status        # check Bluetooth + discovery are running
+  2) list          # see app devices
+  3) send hello    # broadcast a message
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+
 class CommandParser:
     """
     Parses user input into commands.
@@ -78,74 +128,32 @@ class CommandParser:
         raw = input_line.strip()
         
         if not raw:
-            return Command(type=CommandType.UNKNOWN, args=[], raw=raw)
+            return Command(type=CommandType.UNKNOWN, args=(), raw=raw)
         
         parts = raw.split(maxsplit=1)
-        cmd_str = parts[0].lower()
+        cmd_str = parts[0]
         args_str = parts[1] if len(parts) > 1 else ""
         
-        cmd_type = cls.COMMAND_MAP.get(cmd_str, CommandType.UNKNOWN)
+        # Commands are almost always typed in lowercase; only fold case
+        # (allocating a new string) when the exact lookup misses.
+        cmd_type = cls.COMMAND_MAP.get(cmd_str)
+        if cmd_type is None:
+            cmd_type = cls.COMMAND_MAP.get(cmd_str.lower(), CommandType.UNKNOWN)
         
         # Parse arguments based on command type
         if cmd_type == CommandType.SEND:
             # Everything after "send" is the message
-            args = [args_str] if args_str else []
+            args = (args_str,) if args_str else ()
         elif cmd_type in (CommandType.CONNECT, CommandType.DISCONNECT):
             # Single argument: device address
-            args = [args_str.strip()] if args_str else []
+            args = (args_str.strip(),) if args_str else ()
         else:
             # No arguments expected
-            args = args_str.split() if args_str else []
+            args = tuple(args_str.split()) if args_str else ()
         
         return Command(type=cmd_type, args=args, raw=raw)
     
     @classmethod
     def get_help_text(cls) -> str:
         """Get help text for all commands."""
-        return """
-Available Commands:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-  send <message>      Broadcast a message to the mesh network
-                      Aliases: s
-                      Flow: Type your message and send to all peers.
-
-  list                Show connected and discovered app devices
-                      Aliases: ls, devices
-                      Flow: See who is connected and who is discoverable.
-
-  scan                Force an immediate device scan
-                      Aliases: discover
-                      Flow: Use when a new laptop joins and you want it
-                            to appear quickly.
-
-  connect <address>   Connect to a device by address
-                      Aliases: c
-                      Flow: Manually connect when auto-connect fails.
-
-  disconnect <addr>   Disconnect from a device
-                      Aliases: dc
-
-  status              Show live system + discovery status
-                      Aliases: st
-                      Flow: Your main dashboard. Shows Bluetooth state,
-                            GATT server, discovery stats and scan interval.
-
-  stats               Show message statistics
-                      Aliases: statistics
-
-  clear               Clear the screen
-                      Aliases: cls
-
-  help                Show this help message
-                      Aliases: h, ?
-
-  quit                Exit the application
-                      Aliases: exit, q
-
-Tip: Typical flow
-  1) status        # check Bluetooth + discovery are running
-  2) list          # see app devices
-  3) send hello    # broadcast a message
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        return _HELP_TEXT
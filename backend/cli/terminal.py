@@ -7,15 +7,19 @@ Provides an async terminal interface for user interaction.
 import asyncio
 import sys
 import os
-from typing import Optional, Callable, Any, List
-from datetime import datetime
+import select
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Callable, Any, Awaitable, List, Tuple
 
 from cli.commands import CommandParser, Command, CommandType
 from config import Config
+from utils.logger import set_console_stream
 
 
 # ANSI color codes
-class Colors:
+class _ColorsOn:
     """ANSI color codes for terminal output."""
     RESET = "\033[0m"
     BOLD = "\033[1m"
@@ -37,26 +41,106 @@ class Colors:
     BRIGHT_BLUE = "\033[94m"
     BRIGHT_MAGENTA = "\033[95m"
     BRIGHT_CYAN = "\033[96m"
+
+
+class _ColorsOff:
+    """Same names as _ColorsOn, all empty (no tty or NO_COLOR set)."""
+    RESET = ""
+    BOLD = ""
+    DIM = ""
+    
+    # Colors
+    RED = ""
+    GREEN = ""
+    YELLOW = ""
+    BLUE = ""
+    MAGENTA = ""
+    CYAN = ""
+    WHITE = ""
+    
+    # Bright colors
+    BRIGHT_RED = ""
+    BRIGHT_GREEN = ""
+    BRIGHT_YELLOW = ""
+    BRIGHT_BLUE = ""
+    BRIGHT_MAGENTA = ""
+    BRIGHT_CYAN = ""
+
+
+# Chosen once at import; color support doesn't change while running
+Colors = _ColorsOff if (
+    not Config.terminal.COLOR_OUTPUT or not sys.stdout.isatty() or os.environ.get("NO_COLOR")
+) else _ColorsOn
+
+# Composite strings reused across status output and the dashboard
+_BORDER = f"{Colors.BRIGHT_CYAN}║{Colors.RESET}"
+_ROW_SEP = f"{Colors.BRIGHT_CYAN}╟──────────────────────────────────────────────────────────╢{Colors.RESET}"
+_RUNNING = f"{Colors.GREEN}Running{Colors.RESET}"
+_STOPPED = f"{Colors.RED}Stopped{Colors.RESET}"
+_DOT_RUNNING = f"{Colors.GREEN}● Running{Colors.RESET}"
+_DOT_STOPPED = f"{Colors.RED}● Stopped{Colors.RESET}"
+_STATE_COLORS = {"CONNECTED": Colors.GREEN, "CONNECTING": Colors.YELLOW}  # Others: RED
+
+# The banner is static as well, so it is built once at import too
+_BANNER = f"""
+{Colors.BRIGHT_CYAN}╔══════════════════════════════════════════════════════════╗
+║{Colors.BOLD}          Bluetooth Mesh Broadcast Application            {Colors.RESET}{Colors.BRIGHT_CYAN}║
+║{Colors.DIM}                    Terminal Edition                       {Colors.RESET}{Colors.BRIGHT_CYAN}║
+╚══════════════════════════════════════════════════════════╝{Colors.RESET}
+
+"""
+_BANNER_HEIGHT = _BANNER.count("\n")  # Rows the banner occupies
+
+
+def _enable_windows_vt() -> None:
+    """Switch the Windows console into VT mode so it interprets ANSI escapes."""
+    import ctypes
+    
+    ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_uint32()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+
+
+def _as_async(handler: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """Wrap a plain function so every handler can be awaited directly."""
+    if asyncio.iscoroutinefunction(handler):
+        return handler
+    
+    async def wrapper(*args):
+        result = handler(*args)
+        if asyncio.iscoroutine(result):
+            return await result
+        return result
+    
+    return wrapper
+
+
+class _TerminalLogStream:
+    """
+    Console log target while the terminal UI is running.
     
-    @classmethod
-    def disable(cls):
-        """Disable all colors."""
-        cls.RESET = ""
-        cls.BOLD = ""
-        cls.DIM = ""
-        cls.RED = ""
-        cls.GREEN = ""
-        cls.YELLOW = ""
-        cls.BLUE = ""
-        cls.MAGENTA = ""
-        cls.CYAN = ""
-        cls.WHITE = ""
-        cls.BRIGHT_RED = ""
-        cls.BRIGHT_GREEN = ""
-        cls.BRIGHT_YELLOW = ""
-        cls.BRIGHT_BLUE = ""
-        cls.BRIGHT_MAGENTA = ""
-        cls.BRIGHT_CYAN = ""
+    Records arrive on the logging listener thread; each write is handed
+    to the event loop and goes out through TerminalUI._emit, so log lines
+    invalidate the dashboard frame they scroll like any other output.
+    """
+    
+    def __init__(self, ui: "TerminalUI", loop: asyncio.AbstractEventLoop):
+        self._ui = ui
+        self._loop = loop
+    
+    def write(self, text: str) -> int:
+        try:
+            self._loop.call_soon_threadsafe(self._ui._emit, [text])
+        except RuntimeError:
+            # Loop already closed during shutdown
+            sys.__stdout__.write(text)
+        return len(text)
+    
+    def flush(self) -> None:
+        pass
 
 
 class TerminalUI:
@@ -66,77 +150,165 @@ class TerminalUI:
     Handles user input and output without blocking the event loop.
     """
     
+    # Command dispatch: type -> (handler attribute, required args, usage).
+    # Handlers are looked up by name because the Application sets them
+    # after construction.
+    _DISPATCH = {
+        CommandType.SEND: ("_on_send", 1, "send <message>"),
+        CommandType.LIST: ("_on_list", 0, None),
+        CommandType.SCAN: ("_on_scan", 0, None),
+        CommandType.CONNECT: ("_on_connect", 1, "connect <device_address>"),
+        CommandType.DISCONNECT: ("_on_disconnect", 1, "disconnect <device_address>"),
+        CommandType.STATUS: ("_on_status", 0, None),
+        CommandType.STATS: ("_on_stats", 0, None),
+        CommandType.CLEAR: ("_clear_command", 0, None),
+        CommandType.HELP: ("_print_help", 0, None),
+        CommandType.QUIT: ("_handle_quit", 0, None),
+    }
+    
     def __init__(self):
         self._running = False
         self._input_prompt = "> "
         
+        # Stdin is watched by the event loop; complete lines land here
+        self._stdin_fd: Optional[int] = None
+        self._stdin_thread: Optional[threading.Thread] = None
+        self._stdin_buffer = b""
+        self._stdin_lines: asyncio.Queue = asyncio.Queue()
+        
+        # Last formatted message time, keyed by whole second
+        self._ts_cache: Tuple[int, str] = (-1, "")
+        
         # Command handlers (set by Application)
-        self._on_send: Optional[Callable[[str], Any]] = None
-        self._on_list: Optional[Callable[[], Any]] = None
-        self._on_scan: Optional[Callable[[], Any]] = None
-        self._on_connect: Optional[Callable[[str], Any]] = None
-        self._on_disconnect: Optional[Callable[[str], Any]] = None
-        self._on_status: Optional[Callable[[], Any]] = None
-        self._on_stats: Optional[Callable[[], Any]] = None
-        self._on_quit: Optional[Callable[[], Any]] = None
-        self._on_get_live_stats: Optional[Callable[[], Any]] = None  # For live dashboard
+        self._on_send: Optional[Callable[[str], Awaitable[Any]]] = None
+        self._on_list: Optional[Callable[[], Awaitable[Any]]] = None
+        self._on_scan: Optional[Callable[[], Awaitable[Any]]] = None
+        self._on_connect: Optional[Callable[[str], Awaitable[Any]]] = None
+        self._on_disconnect: Optional[Callable[[str], Awaitable[Any]]] = None
+        self._on_status: Optional[Callable[[], Awaitable[Any]]] = None
+        self._on_stats: Optional[Callable[[], Awaitable[Any]]] = None
+        self._on_quit: Optional[Callable[[], Awaitable[Any]]] = None
+        self._on_get_live_stats: Optional[Callable[[], Awaitable[Any]]] = None  # For live dashboard
         
         # Live dashboard
-        self._dashboard_enabled = True
+        self._dashboard_enabled = Config.terminal.SHOW_DASHBOARD
         self._dashboard_task: Optional[asyncio.Task] = None
         self._dashboard_lines = 0
-        self._dashboard_updating = False  # Prevent concurrent updates
-        
-        # Check if colors are supported
-        if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
-            Colors.disable()
+        self._banner_height = 0  # Rows above the dashboard, set by print_banner
+        self._prev_dashboard_lines: List[str] = []  # Last frame, for diffing
+        self._dashboard_dirty = asyncio.Event()  # Set when stats/output change
+        self._last_input_activity = 0.0  # monotonic time of the last input line
+        
+        # All output goes through one writer task while the UI is running,
+        # so notifications and dashboard frames never interleave
+        self._out_q: asyncio.Queue = asyncio.Queue(maxsize=256)
+        self._writer_task: Optional[asyncio.Task] = None
+        self._prev_log_stream = None  # Console log stream to restore on stop
+        
+        # Windows consoles only interpret ANSI escapes (colors, dashboard
+        # positioning, clear_screen) once VT processing is switched on
+        if os.name == "nt":
+            _enable_windows_vt()
+        
+        # Colors are fixed at import, so the one-line notifications can bake
+        # the color codes and trailing prompt into str.format templates;
+        # each print is then one format call and one write.
+        prompt = self._input_prompt
+        self._fmt_own_message = f"{Colors.DIM}[{{}}]{Colors.RESET} {Colors.BRIGHT_GREEN}You{Colors.RESET}: {{}}\n{prompt}"
+        self._fmt_peer_message = f"{Colors.DIM}[{{}}]{Colors.RESET} {Colors.BRIGHT_CYAN}{{}}{Colors.RESET}: {{}}\n{prompt}"
+        self._fmt_app_device = f"{Colors.BRIGHT_GREEN}★{Colors.RESET} {Colors.BRIGHT_GREEN}APP DEVICE{Colors.RESET}: {Colors.CYAN}{{}}{Colors.RESET} | {{}}{{}}\n{prompt}"
+        self._fmt_device = f"{Colors.BLUE}○{Colors.RESET} Device: {Colors.CYAN}{{}}{Colors.RESET} | {{}}{{}}\n{prompt}"
+        self._fmt_connected = f"{Colors.GREEN}✓ Connected:{Colors.RESET} {Colors.CYAN}{{}}{Colors.RESET}{{}}\n{prompt}"
+        self._fmt_disconnected = f"{Colors.RED}✗ Disconnected:{Colors.RESET} {Colors.CYAN}{{}}{Colors.RESET}{{}}\n{prompt}"
+        self._level_formats = {
+            "info": f"{Colors.GREEN}[INFO]{Colors.RESET} {{}}\n{prompt}",
+            "warning": f"{Colors.YELLOW}[WARN]{Colors.RESET} {{}}\n{prompt}",
+            "error": f"{Colors.RED}[ERROR]{Colors.RESET} {{}}\n{prompt}",
+            "debug": f"{Colors.DIM}[DEBUG] {{}}{Colors.RESET}\n{prompt}",
+            "success": f"{Colors.GREEN}[OK]{Colors.RESET} {{}}\n{prompt}",
+        }
+        
+        # Dashboard skeleton: the box drawing and color codes never change,
+        # so each row is a template filled from one values dict per frame
+        # (see _build_dashboard). Device rows use positional templates.
+        edge = _BORDER
+        self._dash_head = [
+            f"{Colors.BOLD}{Colors.BRIGHT_CYAN}╔══════════════════════════════════════════════════════════╗{Colors.RESET}",
+            f"{Colors.BOLD}{edge} {Colors.BOLD}LIVE DEVICE SCANNER & STATS{Colors.RESET}                    {edge}",
+            f"{Colors.BRIGHT_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}",
+            f"{edge} {Colors.BOLD}Local Device (This App):{Colors.RESET}                              {edge}",
+            f"{edge}   {Colors.BRIGHT_GREEN}●{Colors.RESET} {{local_name:<20}} {{local_address:<17}} Status: {{status_color}}{{local_status:<8}}{Colors.RESET} {edge}",
+            _ROW_SEP,
+            f"{edge} {Colors.BOLD}Connected Devices ({{connected_count}}/{{max_connections}}):{Colors.RESET}             {edge}",
+        ]
+        self._dash_connected_row = f"{edge}   {Colors.GREEN}●{Colors.RESET} {{:<15}} {{:<5}} RSSI:{{:<4}} Health:{{:<5}} {edge}"
+        self._dash_no_connected = f"{edge}   {Colors.DIM}No devices connected{Colors.RESET}                                {edge}"
+        self._dash_mid = [
+            _ROW_SEP,
+            f"{edge} {Colors.BOLD}Discovered App Devices ({{app_device_count}}):{Colors.RESET}           {edge}",
+        ]
+        self._dash_app_row = f"{edge}   {Colors.YELLOW}★{Colors.RESET} {{:<15}} {{:<5}} RSSI:{{:<4}} State:{{}}{{:<10}}{Colors.RESET} {edge}"
+        self._dash_no_app_devices = f"{edge}   {Colors.DIM}No app devices discovered{Colors.RESET}                           {edge}"
+        self._dash_more_row = f"{edge}   ... and {{}} more                                     {edge}"
+        # Formatted device rows keyed by their raw fields; steady-state
+        # frames reuse them instead of re-padding every row
+        self._row_cache: OrderedDict = OrderedDict()
+        self._dash_tail = [
+            f"{Colors.BRIGHT_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}",
+            f"{edge} Bluetooth: {{bt_status}} | Connected: {Colors.CYAN}{{connected}}/{{max_conn}}{Colors.RESET}                    {edge}",
+            f"{edge} GATT Server: {{gatt_status}}                                    {edge}",
+            f"{edge} Discovery: {{disc_color}}{{disc_state:12}}{Colors.RESET} | Interval: {Colors.CYAN}{{interval:.1f}}s{Colors.RESET} | Network: {Colors.CYAN}{{net_state}}{Colors.RESET}  {edge}",
+            f"{edge} Devices: Total: {Colors.CYAN}{{total_devices:3}}{Colors.RESET} | App Devices: {Colors.BRIGHT_GREEN}{{app_devices:3}}{Colors.RESET}                      {edge}",
+            f"{edge} Scans: Total: {Colors.CYAN}{{total_scans:4}}{Colors.RESET} | Success: {Colors.GREEN}{{successful_scans:4}}{Colors.RESET} | Found: {Colors.GREEN}{{devices_found:4}}{Colors.RESET} | Empty: {Colors.YELLOW}{{empty_scans:2}}{Colors.RESET}  {edge}",
+            f"{edge} Messages: Sent: {Colors.CYAN}{{sent:4}}{Colors.RESET} | Received: {Colors.GREEN}{{received:4}}{Colors.RESET} | Forwarded: {Colors.YELLOW}{{forwarded:4}}{Colors.RESET}  {edge}",
+            f"{Colors.BRIGHT_CYAN}╚══════════════════════════════════════════════════════════╝{Colors.RESET}",
+            "",  # Empty line before input
+        ]
     
     def print_banner(self):
         """Print application banner."""
-        banner = f"""
-{Colors.BRIGHT_CYAN}╔══════════════════════════════════════════════════════════╗
-║{Colors.BOLD}          Bluetooth Mesh Broadcast Application            {Colors.RESET}{Colors.BRIGHT_CYAN}║
-║{Colors.DIM}                    Terminal Edition                       {Colors.RESET}{Colors.BRIGHT_CYAN}║
-╚══════════════════════════════════════════════════════════╝{Colors.RESET}
-"""
-        print(banner)
+        self._write(_BANNER)
+        self._banner_height = _BANNER_HEIGHT
     
     def print_startup_info(self, local_address: str = None):
         """Print startup information and quick-start flow."""
-        print(f"{Colors.GREEN}[INFO]{Colors.RESET} Application starting...")
+        buf = [f"{Colors.GREEN}[INFO]{Colors.RESET} Application starting...\n"]
         if local_address:
-            print(f"{Colors.GREEN}[INFO]{Colors.RESET} Local address: {Colors.CYAN}{local_address}{Colors.RESET}")
-        print(f"{Colors.DIM}Quick start:{Colors.RESET}")
-        print(f"  1) status   {Colors.DIM}- check Bluetooth + discovery state{Colors.RESET}")
-        print(f"  2) list     {Colors.DIM}- see discovered app devices{Colors.RESET}")
-        print(f"  3) send hi  {Colors.DIM}- broadcast a test message{Colors.RESET}")
-        print(f"{Colors.DIM}Type 'help' for all commands and flows{Colors.RESET}")
-        print()
+            buf.append(f"{Colors.GREEN}[INFO]{Colors.RESET} Local address: {Colors.CYAN}{local_address}{Colors.RESET}\n")
+        buf.append(f"{Colors.DIM}Quick start:{Colors.RESET}\n")
+        buf.append(f"  1) status   {Colors.DIM}- check Bluetooth + discovery state{Colors.RESET}\n")
+        buf.append(f"  2) list     {Colors.DIM}- see discovered app devices{Colors.RESET}\n")
+        buf.append(f"  3) send hi  {Colors.DIM}- broadcast a test message{Colors.RESET}\n")
+        buf.append(f"{Colors.DIM}Type 'help' for all commands and flows{Colors.RESET}\n")
+        if self._dashboard_enabled and self._dashboard_supported():
+            buf.append(f"{Colors.DIM}Set SHOW_DASHBOARD=false to hide the live dashboard{Colors.RESET}\n")
+        buf.append("\n")
+        self._emit(buf)
     
     async def start(self):
         """Start the terminal input loop and live dashboard."""
         self._running = True
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        self._capture_console_logging()
         
-        # Start live dashboard if enabled
-        if self._dashboard_enabled and self._on_get_live_stats:
+        # Start live dashboard if enabled and there is a terminal to draw on
+        if self._dashboard_enabled and self._on_get_live_stats and self._dashboard_supported():
             self._dashboard_task = asyncio.create_task(self._dashboard_loop())
         
+        self._attach_stdin_reader()
+        
         while self._running:
             try:
-                # Use asyncio-friendly input
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: input(self._input_prompt)
-                )
+                line = await self._read_line()
                 
                 if line is None:
+                    # Ctrl+D pressed, or stop() woke us up
+                    if self._running:
+                        await self._handle_quit()
                     break
                 
                 await self._handle_input(line)
                 
-            except EOFError:
-                # Ctrl+D pressed
-                await self._handle_quit()
-                break
             except KeyboardInterrupt:
                 # Ctrl+C pressed
                 print()  # New line after ^C
@@ -144,11 +316,17 @@ class TerminalUI:
                 break
             except Exception as e:
                 self.print_error(f"Input error: {e}")
+        
+        self._detach_stdin_reader()
     
     async def stop(self):
         """Stop the terminal UI."""
         self._running = False
         
+        # Wake the input loop if it is waiting for a line
+        self._detach_stdin_reader()
+        self._stdin_lines.put_nowait(None)
+        
         # Stop dashboard
         if self._dashboard_task:
             self._dashboard_task.cancel()
@@ -156,6 +334,109 @@ class TerminalUI:
                 await self._dashboard_task
             except asyncio.CancelledError:
                 pass
+        
+        # Hand console logging back before the writer goes away
+        if self._prev_log_stream is not None:
+            set_console_stream(self._prev_log_stream)
+            self._prev_log_stream = None
+        
+        # Stop the writer and write out anything it hadn't reached yet
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        self._flush_output()
+    
+    def _capture_console_logging(self) -> None:
+        """Route console log output through _emit while the UI runs."""
+        stream = _TerminalLogStream(self, asyncio.get_running_loop())
+        self._prev_log_stream = set_console_stream(stream)
+    
+    def _attach_stdin_reader(self) -> None:
+        """
+        Watch stdin from the event loop instead of a blocking input() thread.
+        
+        Falls back to a single stdin reader thread when the loop can't
+        watch file descriptors (e.g. the Windows proactor loop).
+        """
+        try:
+            fd = sys.stdin.fileno()
+            asyncio.get_running_loop().add_reader(fd, self._on_stdin_readable, fd)
+        except (AttributeError, ValueError, OSError, NotImplementedError):
+            self._start_stdin_thread()
+            return
+        self._stdin_fd = fd
+    
+    def _start_stdin_thread(self) -> None:
+        """Start one long-lived daemon thread feeding stdin lines to the queue."""
+        if self._stdin_thread is not None:
+            return
+        
+        loop = asyncio.get_running_loop()
+        
+        def reader():
+            while True:
+                try:
+                    line = sys.stdin.readline()
+                except Exception:
+                    line = ""
+                try:
+                    loop.call_soon_threadsafe(
+                        self._stdin_lines.put_nowait,
+                        line.rstrip("\r\n") if line else None
+                    )
+                except RuntimeError:
+                    return  # Loop already closed
+                if not line:
+                    return
+        
+        # Daemon so a thread blocked in readline() never holds up exit
+        self._stdin_thread = threading.Thread(target=reader, name="stdin-reader", daemon=True)
+        self._stdin_thread.start()
+    
+    def _detach_stdin_reader(self) -> None:
+        """Stop watching stdin."""
+        if self._stdin_fd is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(self._stdin_fd)
+        except Exception:
+            pass
+        self._stdin_fd = None
+    
+    def _on_stdin_readable(self, fd: int) -> None:
+        """Split whatever stdin has ready into lines for _read_line."""
+        # Readiness guarantees at least one byte, so this read won't block
+        try:
+            data = os.read(fd, 4096)
+        except OSError:
+            data = b""
+        
+        if not data:
+            # End of input: flush any unterminated line, then signal EOF
+            if self._stdin_buffer:
+                self._stdin_lines.put_nowait(self._stdin_buffer.decode("utf-8", errors="replace"))
+                self._stdin_buffer = b""
+            self._detach_stdin_reader()
+            self._stdin_lines.put_nowait(None)
+            return
+        
+        *lines, self._stdin_buffer = (self._stdin_buffer + data).split(b"\n")
+        for raw in lines:
+            self._stdin_lines.put_nowait(raw.decode("utf-8", errors="replace").rstrip("\r"))
+    
+    async def _read_line(self) -> Optional[str]:
+        """Prompt for and return the next input line, or None at end of input."""
+        self._write(self._input_prompt)
+        line = await self._stdin_lines.get()
+        self._last_input_activity = time.monotonic()
+        # The echoed newline may have scrolled over the dashboard
+        self._prev_dashboard_lines = []
+        self._dashboard_dirty.set()
+        return line
     
     async def _handle_input(self, line: str):
         """Handle a line of user input."""
@@ -163,67 +444,45 @@ class TerminalUI:
         
         if command.type == CommandType.UNKNOWN:
             if command.raw:
-                self.print_error(f"Unknown command: {command.raw.split()[0]}")
-                print(f"{Colors.DIM}Type 'help' for available commands{Colors.RESET}")
+                # One write for the error and hint, so the prompt follows both
+                self.print_error(
+                    f"Unknown command: {command.raw.split()[0]}\n"
+                    f"{Colors.DIM}Type 'help' for available commands{Colors.RESET}"
+                )
             return
         
         await self._execute_command(command)
     
     async def _execute_command(self, command: Command):
         """Execute a parsed command."""
-        try:
-            if command.type == CommandType.SEND:
-                if not command.args or not command.args[0]:
-                    self.print_error("Usage: send <message>")
-                    return
-                if self._on_send:
-                    await self._safe_callback(self._on_send, command.args[0])
-            
-            elif command.type == CommandType.LIST:
-                if self._on_list:
-                    await self._safe_callback(self._on_list)
-            
-            elif command.type == CommandType.SCAN:
-                if self._on_scan:
-                    await self._safe_callback(self._on_scan)
-            
-            elif command.type == CommandType.CONNECT:
-                if not command.args or not command.args[0]:
-                    self.print_error("Usage: connect <device_address>")
-                    return
-                if self._on_connect:
-                    await self._safe_callback(self._on_connect, command.args[0])
-            
-            elif command.type == CommandType.DISCONNECT:
-                if not command.args or not command.args[0]:
-                    self.print_error("Usage: disconnect <device_address>")
-                    return
-                if self._on_disconnect:
-                    await self._safe_callback(self._on_disconnect, command.args[0])
-            
-            elif command.type == CommandType.STATUS:
-                if self._on_status:
-                    await self._safe_callback(self._on_status)
-            
-            elif command.type == CommandType.STATS:
-                if self._on_stats:
-                    await self._safe_callback(self._on_stats)
-            
-            elif command.type == CommandType.CLEAR:
-                self.clear_screen()
-            
-            elif command.type == CommandType.HELP:
-                print(CommandParser.get_help_text())
-            
-            elif command.type == CommandType.QUIT:
-                await self._handle_quit()
+        entry = self._DISPATCH.get(command.type)
+        if entry is None:
+            return
         
+        handler_name, nargs, usage = entry
+        args = command.args[:nargs]
+        if len(args) < nargs or not all(args):
+            self.print_error(f"Usage: {usage}")
+            return
+        
+        try:
+            handler = getattr(self, handler_name)
+            if handler:
+                await self._safe_callback(handler, *args)
         except Exception as e:
             self.print_error(f"Command failed: {e}")
     
+    async def _clear_command(self):
+        """Handle clear command."""
+        self.clear_screen()
+    
+    async def _print_help(self):
+        """Print help for all commands."""
+        self._write(CommandParser.get_help_text() + "\n")
+    
     async def _handle_quit(self):
         """Handle quit command."""
-        print(f"\n{Colors.YELLOW}Shutting down...{Colors.RESET}")
+        self._write(f"\n{Colors.YELLOW}Shutting down...{Colors.RESET}\n")
         self._running = False
         if self._on_quit:
             await self._safe_callback(self._on_quit)
@@ -231,10 +490,7 @@ class TerminalUI:
     async def _safe_callback(self, callback: Callable, *args) -> Any:
         """Safely execute a callback."""
         try:
-            result = callback(*args)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+            return await callback(*args)
         except Exception as e:
             # Only print error if it's not a dashboard callback to avoid spam
             if callback != self._on_get_live_stats:
@@ -245,94 +501,93 @@ class TerminalUI:
     
     def print_message(self, sender: str, content: str, timestamp: float = None, is_own: bool = False):
         """Print a received message."""
-        time_str = datetime.fromtimestamp(timestamp).strftime("%H:%M:%S") if timestamp else datetime.now().strftime("%H:%M:%S")
+        ts = int(timestamp) if timestamp else int(time.time())
+        if ts != self._ts_cache[0]:
+            self._ts_cache = (ts, time.strftime("%H:%M:%S", time.localtime(ts)))
+        time_str = self._ts_cache[1]
         
+        # Use newline instead of \r to preserve messages above dashboard
         if is_own:
-            sender_display = f"{Colors.BRIGHT_GREEN}You{Colors.RESET}"
+            self._emit([self._fmt_own_message.format(time_str, content)])
         else:
-            sender_display = f"{Colors.BRIGHT_CYAN}{sender}{Colors.RESET}"
-        
-        # Use newline instead of \r to preserve messages above dashboard
-        print(f"{Colors.DIM}[{time_str}]{Colors.RESET} {sender_display}: {content}")
-        print(self._input_prompt, end="", flush=True)
+            self._emit([self._fmt_peer_message.format(time_str, sender, content)])
     
     def print_device_found(self, address: str, name: str = None, rssi: int = None, is_app: bool = False):
         """Print device discovery notification."""
         name_str = name or "Unknown"
         rssi_str = f" (RSSI: {rssi})" if rssi else ""
         
-        if is_app:
-            icon = f"{Colors.BRIGHT_GREEN}★{Colors.RESET}"
-            label = f"{Colors.BRIGHT_GREEN}APP DEVICE{Colors.RESET}"
-        else:
-            icon = f"{Colors.BLUE}○{Colors.RESET}"
-            label = "Device"
+        fmt = self._fmt_app_device if is_app else self._fmt_device
         
         # Use newline instead of \r to preserve notifications above dashboard
-        print(f"{icon} {label}: {Colors.CYAN}{address}{Colors.RESET} | {name_str}{rssi_str}")
-        print(self._input_prompt, end="", flush=True)
+        self._emit([fmt.format(address, name_str, rssi_str)])
     
     def print_device_connected(self, address: str, name: str = None):
         """Print device connection notification."""
         name_str = f" ({name})" if name else ""
         # Use newline instead of \r to preserve notifications above dashboard
-        print(f"{Colors.GREEN}✓ Connected:{Colors.RESET} {Colors.CYAN}{address}{Colors.RESET}{name_str}")
-        print(self._input_prompt, end="", flush=True)
+        self._emit([self._fmt_connected.format(address, name_str)])
     
     def print_device_disconnected(self, address: str, name: str = None):
         """Print device disconnection notification."""
         name_str = f" ({name})" if name else ""
         # Use newline instead of \r to preserve notifications above dashboard
-        print(f"{Colors.RED}✗ Disconnected:{Colors.RESET} {Colors.CYAN}{address}{Colors.RESET}{name_str}")
-        print(self._input_prompt, end="", flush=True)
+        self._emit([self._fmt_disconnected.format(address, name_str)])
     
     def print_devices_list(self, connected: list, discovered: list):
         """Print list of devices with richer info and hints."""
-        print(f"\n{Colors.BOLD}Connected Devices ({len(connected)}/{Config.bluetooth.MAX_CONCURRENT_CONNECTIONS}):{Colors.RESET}")
+        buf = [f"\n{Colors.BOLD}Connected Devices ({len(connected)}/{Config.bluetooth.MAX_CONCURRENT_CONNECTIONS}):{Colors.RESET}\n"]
         if connected:
             for dev in connected:
-                addr = dev.get("address", dev.address if hasattr(dev, "address") else str(dev))
-                name = dev.get("name", dev.name if hasattr(dev, "name") else None) or "Unknown"
-                rssi = dev.get("rssi", dev.rssi if hasattr(dev, "rssi") else None)
+                addr, name, rssi = self._dev_fields(dev)
                 rssi_str = f" | RSSI: {rssi}" if rssi is not None else ""
-                print(f"  {Colors.GREEN}●{Colors.RESET} {Colors.CYAN}{addr}{Colors.RESET} | {name}{rssi_str}")
+                buf.append(f"  {Colors.GREEN}●{Colors.RESET} {Colors.CYAN}{addr}{Colors.RESET} | {name}{rssi_str}\n")
         else:
-            print(f"  {Colors.DIM}No connected devices{Colors.RESET}")
+            buf.append(f"  {Colors.DIM}No connected devices{Colors.RESET}\n")
         
-        print(f"\n{Colors.BOLD}Discovered App Devices:{Colors.RESET}")
+        buf.append(f"\n{Colors.BOLD}Discovered App Devices:{Colors.RESET}\n")
         if discovered:
             for dev in discovered:
-                addr = dev.get("address", dev.address if hasattr(dev, "address") else str(dev))
-                name = dev.get("name", dev.name if hasattr(dev, "name") else None) or "Unknown"
-                rssi = dev.get("rssi", dev.rssi if hasattr(dev, "rssi") else None)
+                addr, name, rssi = self._dev_fields(dev)
                 rssi_str = f" | RSSI: {rssi}" if rssi is not None else ""
-                print(f"  {Colors.YELLOW}○{Colors.RESET} {Colors.CYAN}{addr}{Colors.RESET} | {name}{rssi_str}")
+                buf.append(f"  {Colors.YELLOW}○{Colors.RESET} {Colors.CYAN}{addr}{Colors.RESET} | {name}{rssi_str}\n")
         else:
-            print(f"  {Colors.DIM}No app devices discovered{Colors.RESET}")
+            buf.append(f"  {Colors.DIM}No app devices discovered{Colors.RESET}\n")
         
         if not connected and discovered:
-            print(f"\n{Colors.DIM}Hint: devices are discovered but not yet connected.{Colors.RESET}")
-            print(f"{Colors.DIM}      They will auto-connect when slots are free, or use 'connect <address>'.{Colors.RESET}")
+            buf.append(f"\n{Colors.DIM}Hint: devices are discovered but not yet connected.{Colors.RESET}\n")
+            buf.append(f"{Colors.DIM}      They will auto-connect when slots are free, or use 'connect <address>'.{Colors.RESET}\n")
         elif not discovered:
-            print(f"\n{Colors.DIM}Hint: if another laptop is running the app and discoverable,{Colors.RESET}")
-            print(f"{Colors.DIM}      run 'scan' here and 'status' on both to confirm discovery.{Colors.RESET}")
-        print()
+            buf.append(f"\n{Colors.DIM}Hint: if another laptop is running the app and discoverable,{Colors.RESET}\n")
+            buf.append(f"{Colors.DIM}      run 'scan' here and 'status' on both to confirm discovery.{Colors.RESET}\n")
+        buf.append("\n")
+        self._emit(buf)
+    
+    @staticmethod
+    def _dev_fields(dev) -> Tuple[str, str, Optional[int]]:
+        """Get (address, name, rssi) from a device dict or DeviceInfo-like object."""
+        if isinstance(dev, dict):
+            addr = dev["address"] if "address" in dev else str(dev)
+            return addr, dev.get("name") or "Unknown", dev.get("rssi")
+        return (
+            getattr(dev, "address", None) or str(dev),
+            getattr(dev, "name", None) or "Unknown",
+            getattr(dev, "rssi", None),
+        )
     
     def print_status(self, status: dict):
         """Print system status."""
-        print(f"\n{Colors.BOLD}System Status:{Colors.RESET}")
-        print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        buf = [f"\n{Colors.BOLD}System Status:{Colors.RESET}\n"]
+        buf.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
         
         # Bluetooth
         bt = status.get("bluetooth", {})
-        bt_status = f"{Colors.GREEN}Running{Colors.RESET}" if bt.get("running") else f"{Colors.RED}Stopped{Colors.RESET}"
-        print(f"  Bluetooth:     {bt_status}")
-        print(f"  Connected:     {bt.get('connected', 0)}/{bt.get('max', Config.bluetooth.MAX_CONCURRENT_CONNECTIONS)}")
+        buf.append(f"  Bluetooth:     {_RUNNING if bt.get('running') else _STOPPED}\n")
+        buf.append(f"  Connected:     {bt.get('connected', 0)}/{bt.get('max', Config.bluetooth.MAX_CONCURRENT_CONNECTIONS)}\n")
         
         # GATT Server
         gatt = status.get("gatt_server", {})
-        gatt_status = f"{Colors.GREEN}Running{Colors.RESET}" if gatt.get("running") else f"{Colors.RED}Stopped{Colors.RESET}"
-        print(f"  GATT Server:   {gatt_status}")
+        buf.append(f"  GATT Server:   {_RUNNING if gatt.get('running') else _STOPPED}\n")
         
         # Discovery + scanning stats
         disc = status.get("discovery", {})
@@ -340,113 +595,195 @@ class TerminalUI:
         disc_net_state = disc.get("network_state", "Unknown")
         disc_color = Colors.GREEN if disc_state == "SCANNING" else Colors.YELLOW
         
-        print(f"  Discovery:     {disc_color}{disc_state}{Colors.RESET}  "
-              f"(Network: {disc_net_state}, Interval: {disc.get('current_interval', 0.0):.1f}s)")
-        print(f"  App Devices:   {disc.get('app_devices', 0)}")
+        buf.append(f"  Discovery:     {disc_color}{disc_state}{Colors.RESET}  "
+                   f"(Network: {disc_net_state}, Interval: {disc.get('current_interval', 0.0):.1f}s)\n")
+        buf.append(f"  App Devices:   {disc.get('app_devices', 0)}\n")
         
         # Discovery statistics
-        print(f"\n{Colors.BOLD}Discovery Statistics:{Colors.RESET}")
-        print(f"  Total Scans:           {disc.get('total_scans', 0)}")
-        print(f"  Successful Scans:      {disc.get('successful_scans', 0)}")
-        print(f"  Devices Found (new):   {disc.get('devices_found', 0)}")
-        print(f"  Consecutive Empty:     {disc.get('consecutive_empty_scans', 0)}")
+        buf.append(f"\n{Colors.BOLD}Discovery Statistics:{Colors.RESET}\n")
+        buf.append(f"  Total Scans:           {disc.get('total_scans', 0)}\n")
+        buf.append(f"  Successful Scans:      {disc.get('successful_scans', 0)}\n")
+        buf.append(f"  Devices Found (new):   {disc.get('devices_found', 0)}\n")
+        buf.append(f"  Consecutive Empty:     {disc.get('consecutive_empty_scans', 0)}\n")
         
-        print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        buf.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n")
+        self._emit(buf)
     
     def print_stats(self, stats: dict):
         """Print message statistics."""
-        print(f"\n{Colors.BOLD}Message Statistics:{Colors.RESET}")
-        print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        buf = [f"\n{Colors.BOLD}Message Statistics:{Colors.RESET}\n"]
+        buf.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
         
         msg = stats.get("messages", {})
-        print(f"  Messages Sent:      {msg.get('sent', 0)}")
-        print(f"  Messages Received:  {msg.get('received', 0)}")
-        print(f"  Messages Forwarded: {msg.get('forwarded', 0)}")
+        buf.append(f"  Messages Sent:      {msg.get('sent', 0)}\n")
+        buf.append(f"  Messages Received:  {msg.get('received', 0)}\n")
+        buf.append(f"  Messages Forwarded: {msg.get('forwarded', 0)}\n")
         
         router = stats.get("router", {})
-        print(f"\n{Colors.BOLD}Router Statistics:{Colors.RESET}")
-        print(f"  Duplicates Dropped: {router.get('dropped_duplicate', 0)}")
-        print(f"  TTL Expired:        {router.get('dropped_ttl', 0)}")
-        print(f"  Cache Size:         {router.get('cache_size', 0)}")
+        buf.append(f"\n{Colors.BOLD}Router Statistics:{Colors.RESET}\n")
+        buf.append(f"  Duplicates Dropped: {router.get('dropped_duplicate', 0)}\n")
+        buf.append(f"  TTL Expired:        {router.get('dropped_ttl', 0)}\n")
+        buf.append(f"  Cache Size:         {router.get('cache_size', 0)}\n")
         
-        print(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        buf.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n")
+        self._emit(buf)
+    
+    def _write(self, payload: str):
+        """Queue output for the writer task, or write it now if none is running."""
+        if self._writer_task is not None:
+            try:
+                self._out_q.put_nowait(payload)
+                return
+            except asyncio.QueueFull:
+                # Back-pressure: drain the backlog here rather than drop output
+                self._flush_output()
+        self._write_out(payload)
+    
+    def _flush_output(self):
+        """Synchronously write out everything still queued."""
+        chunks = []
+        while not self._out_q.empty():
+            chunks.append(self._out_q.get_nowait())
+        if chunks:
+            self._write_out("".join(chunks))
+    
+    async def _writer_loop(self):
+        """Write queued output, coalescing whatever has piled up into one write."""
+        while True:
+            chunks = [await self._out_q.get()]
+            while not self._out_q.empty():
+                chunks.append(self._out_q.get_nowait())
+            self._write_out("".join(chunks))
+    
+    @staticmethod
+    def _write_out(text: str):
+        """
+        Write text to stdout with as few syscalls as possible.
+        
+        On POSIX the text is encoded once and handed straight to the file
+        descriptor, skipping TextIOWrapper's per-call encode and buffering.
+        Windows consoles (which need the UTF-16 console API) and stdout
+        replacements without a real descriptor go through sys.stdout.
+        """
+        stream = sys.stdout
+        try:
+            fd = stream.fileno() if os.name != "nt" else -1
+        except (AttributeError, OSError, ValueError):
+            fd = -1
+        if fd < 0:
+            stream.write(text)
+            stream.flush()
+            return
+        
+        # Anything print()ed directly must land before this block
+        stream.flush()
+        data = memoryview(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+        while data:
+            try:
+                data = data[os.write(fd, data):]
+            except BlockingIOError:
+                # Non-blocking pipe is full; wait until it drains
+                select.select([], [fd], [])
+    
+    def _emit(self, parts: List[str]):
+        """Write a block of output as a single chunk."""
+        self._write("".join(parts))
+        # Output may have scrolled over the dashboard; repaint it in full
+        self._prev_dashboard_lines = []
+        self._dashboard_dirty.set()
+    
+    def _print_level(self, level: str, message: str):
+        """Print a prefixed status line and repaint the input prompt."""
+        # Use newline instead of \r to preserve logs above dashboard
+        self._emit([self._level_formats[level].format(message)])
     
     def print_info(self, message: str):
         """Print an info message."""
-        # Use newline instead of \r to preserve logs above dashboard
-        print(f"{Colors.GREEN}[INFO]{Colors.RESET} {message}")
-        print(self._input_prompt, end="", flush=True)
+        self._print_level("info", message)
     
     def print_warning(self, message: str):
         """Print a warning message."""
-        # Use newline instead of \r to preserve logs above dashboard
-        print(f"{Colors.YELLOW}[WARN]{Colors.RESET} {message}")
-        print(self._input_prompt, end="", flush=True)
+        self._print_level("warning", message)
     
     def print_error(self, message: str):
         """Print an error message."""
-        # Errors should always be visible, use newline
-        print(f"{Colors.RED}[ERROR]{Colors.RESET} {message}")
-        print(self._input_prompt, end="", flush=True)
+        self._print_level("error", message)
     
-    def print_debug(self, message: str):
-        """Print a debug message (only if debug enabled)."""
+    def print_debug(self, message: str, *args):
+        """
+        Print a debug message (only if debug enabled).
+        
+        Extra args are %-formatted into message only when debug is on, so
+        callers on hot paths don't pay for building a string nobody sees.
+        """
         if Config.terminal.SHOW_DEBUG:
-            # Use newline instead of \r to preserve logs above dashboard
-            print(f"{Colors.DIM}[DEBUG] {message}{Colors.RESET}")
-            print(self._input_prompt, end="", flush=True)
+            self._print_level("debug", message % args if args else message)
     
     def print_success(self, message: str):
         """Print a success message."""
-        # Use newline instead of \r to preserve logs above dashboard
-        print(f"{Colors.GREEN}[OK]{Colors.RESET} {message}")
-        print(self._input_prompt, end="", flush=True)
+        self._print_level("success", message)
     
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        # Home, clear screen and scrollback; no need to spawn a shell for cls/clear
+        self._write("\033[H\033[2J\033[3J")
         self.print_banner()
     
     # ==================== Handler Setters ====================
     
     def set_send_handler(self, handler: Callable[[str], Any]):
         """Set handler for send command."""
-        self._on_send = handler
+        self._on_send = _as_async(handler)
     
     def set_list_handler(self, handler: Callable[[], Any]):
         """Set handler for list command."""
-        self._on_list = handler
+        self._on_list = _as_async(handler)
     
     def set_scan_handler(self, handler: Callable[[], Any]):
         """Set handler for scan command."""
-        self._on_scan = handler
+        self._on_scan = _as_async(handler)
     
     def set_connect_handler(self, handler: Callable[[str], Any]):
         """Set handler for connect command."""
-        self._on_connect = handler
+        self._on_connect = _as_async(handler)
     
     def set_disconnect_handler(self, handler: Callable[[str], Any]):
         """Set handler for disconnect command."""
-        self._on_disconnect = handler
+        self._on_disconnect = _as_async(handler)
     
     def set_status_handler(self, handler: Callable[[], Any]):
         """Set handler for status command."""
-        self._on_status = handler
+        self._on_status = _as_async(handler)
     
     def set_stats_handler(self, handler: Callable[[], Any]):
         """Set handler for stats command."""
-        self._on_stats = handler
+        self._on_stats = _as_async(handler)
     
     def set_quit_handler(self, handler: Callable[[], Any]):
         """Set handler for quit command."""
-        self._on_quit = handler
+        self._on_quit = _as_async(handler)
     
     def set_live_stats_handler(self, handler: Callable[[], Any]):
         """Set handler for getting live stats for dashboard."""
-        self._on_get_live_stats = handler
+        self._on_get_live_stats = _as_async(handler)
     
     # ==================== Live Dashboard ====================
     
+    # Bursts of changes are coalesced into at most one frame per interval
+    _DASHBOARD_MIN_INTERVAL = 0.1  # seconds
+    # Hold repaints this long after input so they don't move the cursor
+    # while the user is working at the prompt
+    _INPUT_QUIET_PERIOD = 0.5  # seconds
+    
+    @staticmethod
+    def _dashboard_supported() -> bool:
+        """Whether stdout is a terminal that can render the dashboard."""
+        return sys.stdout.isatty() and os.environ.get("TERM") != "dumb"
+    
+    def notify_dashboard_dirty(self):
+        """Request a dashboard repaint (call when displayed stats change)."""
+        self._dashboard_dirty.set()
+    
     async def _dashboard_loop(self):
         """Background task to update live dashboard."""
         # Initial clear and dashboard display
@@ -459,6 +796,14 @@ class TerminalUI:
         
         while self._running:
             try:
+                quiet = self._INPUT_QUIET_PERIOD - (time.monotonic() - self._last_input_activity)
+                if quiet > 0:
+                    await asyncio.sleep(quiet)
+                    continue
+                
+                self._dashboard_dirty.clear()
+                started = time.monotonic()
+                
                 if self._on_get_live_stats:
                     stats = await self._safe_callback(self._on_get_live_stats)
                     if stats:
@@ -476,7 +821,17 @@ class TerminalUI:
                         print(f"\n[WARN] Dashboard: Stats handler not set")
                         error_count = 0
                 
-                await asyncio.sleep(2)  # Update every 2 seconds
+                await asyncio.sleep(max(0.0, self._DASHBOARD_MIN_INTERVAL - (time.monotonic() - started)))
+                
+                # Sleep until something changes; the timeout still picks up
+                # stats that change without a notification (e.g. scan counts)
+                try:
+                    await asyncio.wait_for(
+                        self._dashboard_dirty.wait(),
+                        timeout=Config.terminal.DASHBOARD_IDLE_REFRESH
+                    )
+                except asyncio.TimeoutError:
+                    pass
                 
             except asyncio.CancelledError:
                 break
@@ -496,49 +851,37 @@ class TerminalUI:
         if not sys.stdout.isatty():
             return  # Can't update if not a TTY
         
-        # Prevent concurrent updates
-        if self._dashboard_updating:
-            return
-        
-        self._dashboard_updating = True
-        
         try:
             # Build dashboard content first
             lines = self._build_dashboard(stats)
-            self._dashboard_lines = len(lines)
+            prev = [] if first_time else self._prev_dashboard_lines
             
-            # Save cursor position
-            sys.stdout.write("\033[s")
+            # First row below the banner
+            dashboard_start_line = self._banner_height + 1
             
-            # Move to start of dashboard area (after banner, typically around line 6-7)
-            # Use a fixed position that accounts for the banner
-            dashboard_start_line = 7
-            sys.stdout.write(f"\033[{dashboard_start_line};1H")
+            # Save cursor position (DECSC, which tmux/screen honor unlike
+            # the SCO \033[s), then rewrite only the rows that changed
+            parts = ["\0337"]
+            for i, line in enumerate(lines):
+                if i < len(prev) and prev[i] == line:
+                    continue
+                parts.append(f"\033[{dashboard_start_line + i};1H\033[K{line}")
             
-            # Clear ONLY the dashboard area, not the entire screen
-            # Clear each line individually to avoid wiping logs below
-            for i in range(len(lines)):
-                sys.stdout.write("\033[K")  # Clear current line
-                if i < len(lines) - 1:
-                    sys.stdout.write("\n")  # Move to next line
+            # Clear rows the previous frame used but this one doesn't. The
+            # first frame clears a fixed area to wipe whatever was there.
+            old_line_count = 25 if first_time else self._dashboard_lines
+            for i in range(len(lines), old_line_count):
+                parts.append(f"\033[{dashboard_start_line + i};1H\033[K")
             
-            # Move back to start of dashboard
-            sys.stdout.write(f"\033[{dashboard_start_line};1H")
-            
-            # Print dashboard lines
-            for line in lines:
-                sys.stdout.write(line + "\n")
-            
-            # Clear any remaining old dashboard lines (if dashboard got smaller)
-            # Only clear a few extra lines to be safe, not the entire screen
-            max_expected_lines = 25
-            if len(lines) < max_expected_lines:
-                for _ in range(max_expected_lines - len(lines)):
-                    sys.stdout.write("\033[K\n")  # Clear line and move down
+            self._prev_dashboard_lines = lines
+            self._dashboard_lines = len(lines)
             
-            # Restore cursor position (will be at input prompt)
-            sys.stdout.write("\033[u")
-            sys.stdout.flush()
+            if len(parts) > 1:
+                # Restore cursor position (will be at input prompt)
+                parts.append("\0338")
+                # Synchronized update: supporting terminals show the frame
+                # atomically instead of mid-repaint; others ignore the mode
+                self._write("\033[?2026h" + "".join(parts) + "\033[?2026l")
             
         except Exception as e:
             # If ANSI codes fail, log error but don't crash
@@ -546,107 +889,113 @@ class TerminalUI:
             if Config.terminal.SHOW_DEBUG:
                 print(f"\r[DEBUG] Dashboard update error: {e}", end="")
             pass
-        finally:
-            self._dashboard_updating = False
     
-    def _build_dashboard(self, stats: dict) -> List[str]:
-        """Build dashboard content lines."""
-        lines = []
+    _ROW_CACHE_SIZE = 64
+    
+    def _device_row(self, kind: str, name, addr, rssi, status) -> str:
+        """Format one dashboard device row, reusing it if its fields are unchanged."""
+        key = (kind, name, addr, rssi, status)
+        row = self._row_cache.get(key)
+        if row is not None:
+            self._row_cache.move_to_end(key)
+            return row
         
-        # Header
-        lines.append(f"{Colors.BOLD}{Colors.BRIGHT_CYAN}╔══════════════════════════════════════════════════════════╗{Colors.RESET}")
-        lines.append(f"{Colors.BOLD}{Colors.BRIGHT_CYAN}║{Colors.RESET} {Colors.BOLD}LIVE DEVICE SCANNER & STATS{Colors.RESET}                    {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        lines.append(f"{Colors.BRIGHT_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}")
+        rssi_str = f"{rssi}" if rssi != "N/A" and rssi is not None else "N/A"
+        if kind == "connected":
+            health_str = f"{status:.2f}" if status != "N/A" and status is not None else "N/A"
+            row = self._dash_connected_row.format(name[:15], addr[-5:], rssi_str, health_str)
+        else:
+            row = self._dash_app_row.format(name[:15], addr[-5:], rssi_str, _STATE_COLORS.get(status, Colors.RED), status)
         
-        # Local Device Info (this device running the app)
+        self._row_cache[key] = row
+        if len(self._row_cache) > self._ROW_CACHE_SIZE:
+            self._row_cache.popitem(last=False)
+        return row
+    
+    def _build_dashboard(self, stats: dict) -> List[str]:
+        """Build dashboard content lines."""
         local_device = stats.get("local_device", {})
-        local_name = local_device.get("name", "This Device")
-        local_address = local_device.get("address", "N/A")
+        disc = stats.get("discovery", {})
+        bt = stats.get("bluetooth", {})
+        gatt = stats.get("gatt_server", {})
+        msg = stats.get("messages", {})
+        connected_devices = disc.get("connected_devices_list", [])
+        discovered_app_devices = disc.get("discovered_app_devices_list", [])
+        
         local_status = local_device.get("status", "Unknown")
-        status_color = Colors.GREEN if local_status == "Running" else Colors.RED
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} {Colors.BOLD}Local Device (This App):{Colors.RESET}                              {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET}   {Colors.BRIGHT_GREEN}●{Colors.RESET} {local_name:<20} {local_address:<17} Status: {status_color}{local_status:<8}{Colors.RESET} {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        lines.append(f"{Colors.BRIGHT_CYAN}╟──────────────────────────────────────────────────────────╢{Colors.RESET}")
+        disc_state = disc.get("state", "UNKNOWN")
+        values = {
+            # Local Device Info (this device running the app)
+            "local_name": local_device.get("name", "This Device"),
+            "local_address": local_device.get("address", "N/A"),
+            "local_status": local_status,
+            "status_color": Colors.GREEN if local_status == "Running" else Colors.RED,
+            "connected_count": len(connected_devices),
+            "max_connections": Config.bluetooth.MAX_CONCURRENT_CONNECTIONS,
+            "app_device_count": len(discovered_app_devices),
+            # Bluetooth / GATT Server
+            "bt_status": _DOT_RUNNING if bt.get("running") else _DOT_STOPPED,
+            "connected": bt.get("connected", 0),
+            "max_conn": bt.get("max", 0),
+            "gatt_status": _DOT_RUNNING if gatt.get("running") else _DOT_STOPPED,
+            # Discovery Status
+            "disc_state": disc_state,
+            "disc_color": Colors.GREEN if disc_state == "SCANNING" else Colors.YELLOW,
+            "interval": disc.get("current_interval", 0.0),
+            "net_state": disc.get("network_state", "UNKNOWN"),
+            # Device Counts
+            "total_devices": disc.get("total_devices", 0),
+            "app_devices": disc.get("app_devices", 0),
+            # Discovery Stats
+            "total_scans": disc.get("total_scans", 0),
+            "successful_scans": disc.get("successful_scans", 0),
+            "devices_found": disc.get("devices_found", 0),
+            "empty_scans": disc.get("consecutive_empty_scans", 0),
+            # Message Stats
+            "sent": msg.get("sent", 0),
+            "received": msg.get("received", 0),
+            "forwarded": msg.get("forwarded", 0),
+        }
         
         # Connected Devices (at the top)
-        connected_devices = stats.get("discovery", {}).get("connected_devices_list", [])
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} {Colors.BOLD}Connected Devices ({len(connected_devices)}/{Config.bluetooth.MAX_CONCURRENT_CONNECTIONS}):{Colors.RESET}             {Colors.BRIGHT_CYAN}║{Colors.RESET}")
         if connected_devices:
-            for i, dev in enumerate(connected_devices[:5]):  # Show up to 5
-                addr = dev.get("address", "N/A")
-                name = dev.get("name", "Unknown")
-                rssi = dev.get("rssi", "N/A")
-                health = dev.get("health_score", "N/A")
-                rssi_str = f"{rssi}" if rssi != "N/A" and rssi is not None else "N/A"
-                health_str = f"{health:.2f}" if health != "N/A" and health is not None else "N/A"
-                line = f"{Colors.BRIGHT_CYAN}║{Colors.RESET}   {Colors.GREEN}●{Colors.RESET} {name[:15]:<15} {addr[-5:]:<5} RSSI:{rssi_str:<4} Health:{health_str:<5} {Colors.BRIGHT_CYAN}║{Colors.RESET}"
-                lines.append(line)
+            connected_rows = [
+                self._device_row(
+                    "connected",
+                    dev.get("name", "Unknown"),
+                    dev.get("address", "N/A"),
+                    dev.get("rssi", "N/A"),
+                    dev.get("health_score", "N/A"),
+                )
+                for dev in connected_devices[:5]  # Show up to 5
+            ]
             if len(connected_devices) > 5:
-                lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET}   ... and {len(connected_devices) - 5} more                                     {Colors.BRIGHT_CYAN}║{Colors.RESET}")
+                connected_rows.append(self._dash_more_row.format(len(connected_devices) - 5))
         else:
-            lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET}   {Colors.DIM}No devices connected{Colors.RESET}                                {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        lines.append(f"{Colors.BRIGHT_CYAN}╟──────────────────────────────────────────────────────────╢{Colors.RESET}")
+            connected_rows = [self._dash_no_connected]
         
-        # Discovered App Devices (at the top)
-        discovered_app_devices = stats.get("discovery", {}).get("discovered_app_devices_list", [])
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} {Colors.BOLD}Discovered App Devices ({len(discovered_app_devices)}):{Colors.RESET}           {Colors.BRIGHT_CYAN}║{Colors.RESET}")
+        # Discovered App Devices
         if discovered_app_devices:
-            for i, dev in enumerate(discovered_app_devices[:5]):  # Show up to 5
-                addr = dev.get("address", "N/A")
-                name = dev.get("name", "Unknown")
-                rssi = dev.get("rssi", "N/A")
-                state = dev.get("state", "N/A")
-                rssi_str = f"{rssi}" if rssi != "N/A" and rssi is not None else "N/A"
-                state_color = Colors.GREEN if state == "CONNECTED" else Colors.YELLOW if state == "CONNECTING" else Colors.RED
-                line = f"{Colors.BRIGHT_CYAN}║{Colors.RESET}   {Colors.YELLOW}★{Colors.RESET} {name[:15]:<15} {addr[-5:]:<5} RSSI:{rssi_str:<4} State:{state_color}{state:<10}{Colors.RESET} {Colors.BRIGHT_CYAN}║{Colors.RESET}"
-                lines.append(line)
+            app_rows = [
+                self._device_row(
+                    "app",
+                    dev.get("name", "Unknown"),
+                    dev.get("address", "N/A"),
+                    dev.get("rssi", "N/A"),
+                    dev.get("state", "N/A"),
+                )
+                for dev in discovered_app_devices[:5]  # Show up to 5
+            ]
             if len(discovered_app_devices) > 5:
-                lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET}   ... and {len(discovered_app_devices) - 5} more                                     {Colors.BRIGHT_CYAN}║{Colors.RESET}")
+                app_rows.append(self._dash_more_row.format(len(discovered_app_devices) - 5))
         else:
-            lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET}   {Colors.DIM}No app devices discovered{Colors.RESET}                           {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        lines.append(f"{Colors.BRIGHT_CYAN}╠══════════════════════════════════════════════════════════╣{Colors.RESET}")
-        
-        # Bluetooth Status
-        bt = stats.get("bluetooth", {})
-        bt_status = f"{Colors.GREEN}● Running{Colors.RESET}" if bt.get("running") else f"{Colors.RED}● Stopped{Colors.RESET}"
-        connected = bt.get("connected", 0)
-        max_conn = bt.get("max", 0)
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} Bluetooth: {bt_status} | Connected: {Colors.CYAN}{connected}/{max_conn}{Colors.RESET}                    {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        
-        # GATT Server
-        gatt = stats.get("gatt_server", {})
-        gatt_status = f"{Colors.GREEN}● Running{Colors.RESET}" if gatt.get("running") else f"{Colors.RED}● Stopped{Colors.RESET}"
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} GATT Server: {gatt_status}                                    {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        
-        # Discovery Status
-        disc = stats.get("discovery", {})
-        disc_state = disc.get("state", "UNKNOWN")
-        disc_color = Colors.GREEN if disc_state == "SCANNING" else Colors.YELLOW
-        interval = disc.get("current_interval", 0.0)
-        net_state = disc.get("network_state", "UNKNOWN")
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} Discovery: {disc_color}{disc_state:12}{Colors.RESET} | Interval: {Colors.CYAN}{interval:.1f}s{Colors.RESET} | Network: {Colors.CYAN}{net_state}{Colors.RESET}  {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        
-        # Device Counts
-        total_devices = disc.get("total_devices", 0)
-        app_devices = disc.get("app_devices", 0)
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} Devices: Total: {Colors.CYAN}{total_devices:3}{Colors.RESET} | App Devices: {Colors.BRIGHT_GREEN}{app_devices:3}{Colors.RESET}                      {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        
-        # Discovery Stats
-        total_scans = disc.get("total_scans", 0)
-        successful_scans = disc.get("successful_scans", 0)
-        devices_found = disc.get("devices_found", 0)
-        empty_scans = disc.get("consecutive_empty_scans", 0)
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} Scans: Total: {Colors.CYAN}{total_scans:4}{Colors.RESET} | Success: {Colors.GREEN}{successful_scans:4}{Colors.RESET} | Found: {Colors.GREEN}{devices_found:4}{Colors.RESET} | Empty: {Colors.YELLOW}{empty_scans:2}{Colors.RESET}  {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        
-        # Message Stats
-        msg = stats.get("messages", {})
-        sent = msg.get("sent", 0)
-        received = msg.get("received", 0)
-        forwarded = msg.get("forwarded", 0)
-        lines.append(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} Messages: Sent: {Colors.CYAN}{sent:4}{Colors.RESET} | Received: {Colors.GREEN}{received:4}{Colors.RESET} | Forwarded: {Colors.YELLOW}{forwarded:4}{Colors.RESET}  {Colors.BRIGHT_CYAN}║{Colors.RESET}")
-        
-        # Footer
-        lines.append(f"{Colors.BRIGHT_CYAN}╚══════════════════════════════════════════════════════════╝{Colors.RESET}")
-        lines.append("")  # Empty line before input
-        
-        return lines
+            app_rows = [self._dash_no_app_devices]
+        
+        # Assemble the frame in one go rather than growing it row by row
+        return [
+            *(tpl.format_map(values) for tpl in self._dash_head),
+            *connected_rows,
+            *(tpl.format_map(values) for tpl in self._dash_mid),
+            *app_rows,
+            *(tpl.format_map(values) for tpl in self._dash_tail),
+        ]
@@ -6,33 +6,53 @@ All values can be overridden via environment variables.
 """
 
 import os
-from typing import List
+import re
+from typing import List, Sequence, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file, once per process. reload()
+# re-runs this module in the same namespace, so the flag survives it.
+if not globals().get("_DOTENV_LOADED"):
+    load_dotenv()
+    _DOTENV_LOADED = True
+
+
+# os.environ is already populated by load_dotenv; read it directly and
+# return defaults as-is instead of round-tripping them through str()
+_ENV = os.environ
+
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
 
 
 def get_bool_env(key: str, default: bool) -> bool:
     """Get boolean value from environment variable."""
-    value = os.getenv(key, str(default)).lower()
-    return value in ("true", "1", "yes", "on")
+    value = _ENV.get(key)
+    if value is None:
+        return default
+    return value.lower() in _TRUE_VALUES
 
 
 def get_int_env(key: str, default: int) -> int:
     """Get integer value from environment variable."""
-    try:
-        return int(os.getenv(key, str(default)))
-    except ValueError:
+    value = _ENV.get(key)
+    if value is None:
         return default
+    value = value.strip()
+    # Validate up front so malformed values fall back without an exception
+    if (value[1:] if value[:1] in ("-", "+") else value).isdecimal():
+        return int(value)
+    return default
+
+
+_LIST_SPLIT = re.compile(r"\s*,\s*").split
 
 
-def get_list_env(key: str, default: List[str]) -> List[str]:
+def get_list_env(key: str, default: Sequence[str]) -> Tuple[str, ...]:
     """Get list value from environment variable (comma-separated)."""
-    value = os.getenv(key)
+    value = _ENV.get(key)
     if value:
-        return [item.strip() for item in value.split(",")]
-    return default
+        return tuple(_LIST_SPLIT(value.strip()))
+    return tuple(default)
 
 
 class BluetoothConfig:
@@ -63,6 +83,7 @@ class BluetoothConfig:
     
     # Device tracking
     DEVICE_LOST_THRESHOLD = get_int_env("DEVICE_LOST_THRESHOLD", 60)  # seconds
+    MAX_DISCOVERED_DEVICES = get_int_env("MAX_DISCOVERED_DEVICES", 1024)  # cache entries
     CONNECTION_BLACKLIST_DURATION = get_int_env("CONNECTION_BLACKLIST_DURATION", 60)  # seconds
     
     # Scanner timeouts
@@ -100,6 +121,9 @@ class ResourceConfig:
     
     # Connection limits
     MAX_TOTAL_CONNECTIONS = get_int_env("MAX_TOTAL_CONNECTIONS", 5)  # 4 peer + 1 incoming
+    
+    # Default asyncio executor (blocking library calls such as DNS lookups)
+    MAX_EXECUTOR_WORKERS = get_int_env("MAX_EXECUTOR_WORKERS", 4)
 
 
 class SecurityConfig:
@@ -145,6 +169,8 @@ class TerminalConfig:
     MAX_DISPLAYED_MESSAGES = get_int_env("MAX_DISPLAYED_MESSAGES", 50)
     SHOW_DEBUG = get_bool_env("SHOW_DEBUG", False)
     COLOR_OUTPUT = get_bool_env("COLOR_OUTPUT", True)
+    SHOW_DASHBOARD = get_bool_env("SHOW_DASHBOARD", True)
+    DASHBOARD_IDLE_REFRESH = get_int_env("DASHBOARD_IDLE_REFRESH", 5)  # seconds
     
     # Auto-connect behavior
     AUTO_CONNECT = get_bool_env("AUTO_CONNECT", True)
@@ -178,23 +204,19 @@ class Config:
     @classmethod
     def validate(cls) -> bool:
         """Validate configuration settings."""
-        errors = []
-        
-        # Validate message size
-        if cls.message.MAX_CONTENT_LENGTH >= cls.message.MAX_MESSAGE_SIZE:
-            errors.append("MAX_CONTENT_LENGTH must be less than MAX_MESSAGE_SIZE")
-        
-        # Validate connection limits
-        if cls.bluetooth.MAX_CONCURRENT_CONNECTIONS > cls.resource.MAX_TOTAL_CONNECTIONS:
-            errors.append("MAX_CONCURRENT_CONNECTIONS cannot exceed MAX_TOTAL_CONNECTIONS")
-        
-        # Validate rate limits
-        if cls.message.RATE_LIMIT_PER_CONNECTION > cls.message.RATE_LIMIT_PER_DEVICE:
-            errors.append("RATE_LIMIT_PER_CONNECTION should not exceed RATE_LIMIT_PER_DEVICE")
+        checks = (
+            # Validate message size
+            (cls.message.MAX_CONTENT_LENGTH >= cls.message.MAX_MESSAGE_SIZE,
+             "MAX_CONTENT_LENGTH must be less than MAX_MESSAGE_SIZE"),
+            # Validate connection limits
+            (cls.bluetooth.MAX_CONCURRENT_CONNECTIONS > cls.resource.MAX_TOTAL_CONNECTIONS,
+             "MAX_CONCURRENT_CONNECTIONS cannot exceed MAX_TOTAL_CONNECTIONS"),
+            # Validate rate limits
+            (cls.message.RATE_LIMIT_PER_CONNECTION > cls.message.RATE_LIMIT_PER_DEVICE,
+             "RATE_LIMIT_PER_CONNECTION should not exceed RATE_LIMIT_PER_DEVICE"),
+        )
         
+        errors = [message for failed, message in checks if failed]
         if errors:
-            for error in errors:
-                print(f"Config Error: {error}")
-            return False
-        
-        return True
+            print("\n".join(f"Config Error: {error}" for error in errors))
+        return not errors
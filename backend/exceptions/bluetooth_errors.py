@@ -6,6 +6,9 @@ Bluetooth-specific exceptions.
 class BluetoothError(Exception):
     """Base exception for Bluetooth-related errors."""
     
+    # Attributes serialized by to_dict, in order; subclasses extend this
+    _FIELDS = ("message", "device_address")
+    
     def __init__(self, message: str, device_address: str = None):
         self.message = message
         self.device_address = device_address
@@ -13,24 +16,20 @@ class BluetoothError(Exception):
     
     def to_dict(self) -> dict:
         """Convert to dictionary for logging/API response."""
-        return {
-            "error_type": self.__class__.__name__,
-            "message": self.message,
-            "device_address": self.device_address,
-        }
+        result = {"error_type": self.__class__.__name__}
+        for name in self._FIELDS:
+            result[name] = getattr(self, name)
+        return result
 
 
 class BluetoothConnectionError(BluetoothError):
     """Error establishing or maintaining a Bluetooth connection."""
     
+    _FIELDS = BluetoothError._FIELDS + ("retry_count",)
+    
     def __init__(self, message: str, device_address: str = None, retry_count: int = 0):
         super().__init__(message, device_address)
         self.retry_count = retry_count
-    
-    def to_dict(self) -> dict:
-        result = super().to_dict()
-        result["retry_count"] = self.retry_count
-        return result
 
 
 class BluetoothDiscoveryError(BluetoothError):
@@ -41,14 +40,11 @@ class BluetoothDiscoveryError(BluetoothError):
 class BluetoothTimeoutError(BluetoothError):
     """Timeout during Bluetooth operation."""
     
+    _FIELDS = BluetoothError._FIELDS + ("timeout_seconds",)
+    
     def __init__(self, message: str, device_address: str = None, timeout_seconds: float = None):
         super().__init__(message, device_address)
         self.timeout_seconds = timeout_seconds
-    
-    def to_dict(self) -> dict:
-        result = super().to_dict()
-        result["timeout_seconds"] = self.timeout_seconds
-        return result
 
 
 class BluetoothAdapterError(BluetoothError):
@@ -23,12 +23,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import Config
 from utils.logger import setup_logging, get_logger
+from utils.helpers import use_bounded_executor, use_fast_event_loop
 from utils.resource_monitor import ResourceMonitor
 from bluetooth.manager import BluetoothManager
 from bluetooth.discovery import DeviceDiscovery
 from bluetooth.connection_pool import ConnectionPool
 from bluetooth.gatt_server import BLEGATTServer
 from messaging.handler import MessageHandler
+from messaging.relay import PeerRelay
 
 # Web server imports (optional - web module may not exist)
 try:
@@ -62,6 +64,9 @@ class Application:
     Uses a single asyncio event loop for all async operations.
     """
     
+    # Connect/disconnect bursts within this window share one device list emit
+    _DEVICE_EMIT_DELAY = 0.05  # seconds
+    
     def __init__(self):
         self._running = False
         self._shutdown_event = asyncio.Event()
@@ -78,6 +83,10 @@ class Application:
         self._app: Optional[web.Application] = None
         self._runner: Optional[web.AppRunner] = None
         self._site: Optional[web.TCPSite] = None
+        self._device_emit_pending: Optional[asyncio.Task] = None
+        self._last_emitted_addresses: Optional[frozenset] = None
+        
+        self._peer_relay: Optional[PeerRelay] = None
     
     async def initialize(self) -> bool:
         """
@@ -117,6 +126,12 @@ class Application:
             logger.info("Initializing connection pool...")
             self._connection_pool = ConnectionPool()
             
+            # Per-peer forward queues, fed by the message handlers
+            self._peer_relay = PeerRelay(
+                self._bluetooth_manager.send_data,
+                on_sent=self._connection_pool.record_message_sent
+            )
+            
             # Initialize Message Handler
             logger.info("Initializing message handler...")
             self._message_handler = MessageHandler(
@@ -147,9 +162,7 @@ class Application:
             return True
             
         except Exception as e:
-            logger.error(f"Initialization failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Initialization failed: {e}")
             return False
     
     def _setup_callbacks(self):
@@ -192,7 +205,8 @@ class Application:
     
     async def _on_device_connected(self, device_info):
         """Handle device connection."""
-        logger.info(f"✅ Device connected: {device_info.address}")
+        logger.info("✅ Device connected: %s", device_info.address)
+        self._peer_relay.start(device_info.address)
         
         # Add to connection pool
         await self._connection_pool.add_connection(
@@ -210,7 +224,8 @@ class Application:
     
     async def _on_device_disconnected(self, device_info):
         """Handle device disconnection."""
-        logger.info(f"❌ Device disconnected: {device_info.address}")
+        logger.info("❌ Device disconnected: %s", device_info.address)
+        await self._peer_relay.stop(device_info.address)
         
         # Remove from connection pool
         await self._connection_pool.remove_connection(device_info.address)
@@ -223,26 +238,17 @@ class Application:
         # Update UI
         await self._emit_device_update()
     
-    async def _on_bluetooth_message(self, address: str, data: dict):
+    async def _on_bluetooth_message(self, address: str, data: bytes):
         """Handle incoming Bluetooth message from a connected device."""
         try:
-            import json
-            if isinstance(data, dict):
-                message_bytes = json.dumps(data).encode('utf-8')
-            elif isinstance(data, bytes):
-                message_bytes = data
-            else:
-                message_bytes = str(data).encode('utf-8')
-            
             # Record message received in connection pool
             if self._connection_pool:
-                await self._connection_pool.record_message_received(address, len(message_bytes))
+                await self._connection_pool.record_message_received(address, len(data))
             
-            connected = await self._bluetooth_manager.get_connected_devices()
-            connected_addresses = [d.address for d in connected]
+            connected_addresses = self._bluetooth_manager.get_connected_addresses()
             
             message, forward_to = await self._message_handler.receive_message(
-                message_bytes,
+                data,
                 source_device=address,
                 connected_devices=connected_addresses
             )
@@ -250,23 +256,19 @@ class Application:
             if forward_to and message:
                 forward_data = await self._message_handler.prepare_for_forwarding(message)
                 if forward_data:
-                    for target in forward_to:
-                        success = await self._bluetooth_manager.send_data(target, forward_data)
-                        if success and self._connection_pool:
-                            await self._connection_pool.record_message_sent(target, len(forward_data))
+                    self._peer_relay.enqueue(forward_to, forward_data)
             
         except Exception as e:
-            logger.error(f"Error processing Bluetooth message: {e}")
+            logger.error("Error processing Bluetooth message: %s", e)
     
     async def _on_gatt_message_received(self, client_address: str, data: bytes):
         """Handle message received via GATT server (from incoming connection)."""
-        logger.info(f"📨 Message received via GATT from {client_address}")
+        logger.info("📨 Message received via GATT from %s", client_address)
         
         try:
-            connected = []
+            connected_addresses = []
             if self._bluetooth_manager:
-                connected = await self._bluetooth_manager.get_connected_devices()
-            connected_addresses = [d.address for d in connected]
+                connected_addresses = self._bluetooth_manager.get_connected_addresses()
             
             message, forward_to = await self._message_handler.receive_message(
                 data,
@@ -280,41 +282,42 @@ class Application:
                 if forward_data:
                     # Forward via BLE client connections
                     if self._bluetooth_manager:
-                        for target in forward_to:
-                            await self._bluetooth_manager.send_data(target, forward_data)
+                        self._peer_relay.enqueue(forward_to, forward_data)
                     
                     # Also broadcast via GATT server to other connected clients
                     if self._gatt_server:
                         await self._gatt_server.send_notification(forward_data)
             
         except Exception as e:
-            logger.error(f"Error processing GATT message: {e}")
+            logger.error("Error processing GATT message: %s", e)
     
     async def _on_app_device_found(self, device_info):
         """Handle discovery of app device (advertising our service UUID)."""
-        logger.info(f"🎉 APP DEVICE FOUND: {device_info.address}")
-        logger.info(f"   Name: {device_info.name or 'Unknown'}")
-        logger.info(f"   This device is running our application!")
+        logger.info("🎉 APP DEVICE FOUND: %s", device_info.address)
+        logger.info("   Name: %s", device_info.name or 'Unknown')
+        logger.info("   This device is running our application!")
         
         # Try to connect
+        if self._bluetooth_manager.is_connected(device_info.address):
+            return
         if self._connection_pool and self._connection_pool.available_slots > 0:
             try:
-                logger.info(f"🔌 Connecting to app device {device_info.address}...")
+                logger.info("🔌 Connecting to app device %s...", device_info.address)
                 success = await self._bluetooth_manager.connect_to_device(device_info.address)
                 if success:
-                    logger.info(f"✅ CONNECTED TO APP DEVICE: {device_info.address}")
+                    logger.info("✅ CONNECTED TO APP DEVICE: %s", device_info.address)
                 else:
-                    logger.warning(f"❌ Connection to {device_info.address} failed")
+                    logger.warning("❌ Connection to %s failed", device_info.address)
             except Exception as e:
-                logger.error(f"❌ Connection error: {e}")
+                logger.error("❌ Connection error: %s", e)
     
     async def _on_device_found(self, device_info):
         """Handle discovery of any device."""
-        logger.debug(f"📱 Device discovered: {device_info.address} | {device_info.name or 'Unknown'}")
+        logger.debug("📱 Device discovered: %s | %s", device_info.address, device_info.name or 'Unknown')
     
     async def _on_device_lost(self, device_info):
         """Handle device lost from discovery."""
-        logger.debug(f"Device lost: {device_info.address}")
+        logger.debug("Device lost: %s", device_info.address)
     
     async def _on_message_received(self, message):
         """Handle received message (for UI)."""
@@ -331,11 +334,29 @@ class Application:
         logger.error(f"Resource error: {message}")
     
     async def _emit_device_update(self):
-        """Emit device list update to web clients."""
-        if WEB_SERVER_AVAILABLE and self._bluetooth_manager:
+        """Schedule a device list update to web clients, coalescing bursts."""
+        if not (WEB_SERVER_AVAILABLE and self._bluetooth_manager):
+            return
+        if self._device_emit_pending is None:
+            self._device_emit_pending = asyncio.create_task(self._flush_device_update())
+    
+    async def _flush_device_update(self):
+        """Emit the latest device list once the coalescing window closes."""
+        await asyncio.sleep(self._DEVICE_EMIT_DELAY)
+        # Events arriving from here on schedule a fresh emit
+        self._device_emit_pending = None
+        try:
+            # Connect/disconnect pairs inside one window can cancel out
+            addresses = frozenset(self._bluetooth_manager.get_connected_addresses())
+            if addresses == self._last_emitted_addresses:
+                return
+            self._last_emitted_addresses = addresses
+            
             devices = await self._bluetooth_manager.get_connected_devices()
             device_list = [d.to_dict() for d in devices]
             await emit_devices_updated(device_list, len(device_list))
+        except Exception as e:
+            logger.error(f"Error emitting device update: {e}")
     
     async def start(self):
         """Start the application - all components in single event loop."""
@@ -428,6 +449,13 @@ class Application:
         logger.info("Stopping application...")
         self._running = False
         
+        if self._device_emit_pending:
+            self._device_emit_pending.cancel()
+            self._device_emit_pending = None
+        
+        if self._peer_relay:
+            await self._peer_relay.stop_all()
+        
         # Stop web server
         if self._site:
             await self._site.stop()
@@ -467,9 +495,11 @@ async def main():
     # Create application
     app = Application()
     
-    # Set up signal handlers
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     
+    use_bounded_executor(loop, Config.resource.MAX_EXECUTOR_WORKERS)
+    
+    # Set up signal handlers
     def signal_handler():
         logger.info("Received shutdown signal")
         app.request_shutdown()
@@ -489,9 +519,7 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
     except Exception as e:
-        logger.error(f"Application error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Application error: {e}")
         sys.exit(1)
     finally:
         await app.stop()
@@ -500,4 +528,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    use_fast_event_loop()
     asyncio.run(main())
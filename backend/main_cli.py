@@ -23,6 +23,7 @@ _error_filter = setup_error_suppression()
 # Now import Config and logging
 from config import Config
 from utils.logger import setup_logging, get_logger
+from utils.helpers import use_bounded_executor, use_fast_event_loop
 
 # Set up logging after Config is available
 setup_logging()
@@ -32,6 +33,7 @@ from bluetooth.discovery import DeviceDiscovery
 from bluetooth.gatt_server import BLEGATTServer
 from bluetooth.connection_pool import ConnectionPool
 from messaging.handler import MessageHandler
+from messaging.relay import PeerRelay
 
 logger = get_logger(__name__)
 
@@ -58,6 +60,8 @@ class Application:
         
         # Messaging
         self._message_handler: Optional[MessageHandler] = None
+        
+        self._peer_relay: Optional[PeerRelay] = None
     
     async def initialize(self) -> bool:
         """Initialize all application components."""
@@ -122,6 +126,12 @@ class Application:
                 print(f"[WARN] Connection pool initialization failed: {e}")
                 self._connection_pool = None
             
+            # Per-peer forward queues, fed by the message handlers
+            self._peer_relay = PeerRelay(
+                self._bluetooth_manager.send_data,
+                on_sent=self._connection_pool.record_message_sent if self._connection_pool else None
+            )
+            
             # Initialize Message Handler
             logger.info("Initializing message handler...")
             print("[INIT] Initializing message handler...")
@@ -147,8 +157,6 @@ class Application:
         except Exception as e:
             logger.error(f"Initialization failed: {e}", exc_info=True)
             print(f"[ERROR] Initialization failed: {e}")
-            import traceback
-            traceback.print_exc()
             return False
     
     def _setup_callbacks(self):
@@ -196,16 +204,17 @@ class Application:
             # Get connected devices
             connected_addresses = []
             if self._bluetooth_manager:
-                devices = await self._bluetooth_manager.get_connected_devices()
-                connected_addresses = [d.address for d in devices]
+                connected_addresses = self._bluetooth_manager.get_connected_addresses()
             
             # Send through message handler
             targets = await self._message_handler.send_message(message, connected_addresses)
             
+            # Encode once for every peer and the GATT notification
+            message_bytes = message.to_bytes()
+            
             # Send via Bluetooth
             sent_count = 0
             if self._bluetooth_manager and targets:
-                message_bytes = message.to_bytes()
                 for target in targets:
                     try:
                         success = await self._bluetooth_manager.send_data(target, message_bytes)
@@ -220,7 +229,7 @@ class Application:
             # Also broadcast via GATT server
             if self._gatt_server and self._gatt_server.is_running:
                 try:
-                    await self._gatt_server.broadcast_message(message.to_dict())
+                    await self._gatt_server.send_notification(message_bytes)
                 except Exception:
                     pass
             
@@ -486,6 +495,7 @@ class Application:
     
     async def _on_device_connected(self, device_info):
         """Handle device connection."""
+        self._peer_relay.start(device_info.address)
         self._terminal.print_device_connected(
             address=device_info.address,
             name=device_info.name
@@ -500,6 +510,7 @@ class Application:
     
     async def _on_device_disconnected(self, device_info):
         """Handle device disconnection."""
+        await self._peer_relay.stop(device_info.address)
         self._terminal.print_device_disconnected(
             address=device_info.address,
             name=device_info.name
@@ -512,30 +523,21 @@ class Application:
                 count = await self._bluetooth_manager.get_connection_count() if self._bluetooth_manager else 0
                 self._resource_monitor.update_connection_count(count)
     
-    async def _on_bluetooth_message(self, address: str, data: dict):
+    async def _on_bluetooth_message(self, address: str, data: bytes):
         """Handle incoming Bluetooth message."""
         try:
-            import json
-            if isinstance(data, dict):
-                message_bytes = json.dumps(data).encode('utf-8')
-            elif isinstance(data, bytes):
-                message_bytes = data
-            else:
-                message_bytes = str(data).encode('utf-8')
-            
             # Record message received in connection pool
             if self._connection_pool:
-                await self._connection_pool.record_message_received(address, len(message_bytes))
+                await self._connection_pool.record_message_received(address, len(data))
             
-            connected = await self._bluetooth_manager.get_connected_devices() if self._bluetooth_manager else []
-            connected_addresses = [d.address for d in connected]
+            connected_addresses = self._bluetooth_manager.get_connected_addresses() if self._bluetooth_manager else []
             
             if not self._message_handler:
                 logger.warning("Message handler not available, cannot process message")
                 return
             
             message, forward_to = await self._message_handler.receive_message(
-                message_bytes,
+                data,
                 source_device=address,
                 connected_devices=connected_addresses
             )
@@ -543,24 +545,16 @@ class Application:
             # Forward if needed
             if forward_to and message:
                 forward_data = await self._message_handler.prepare_for_forwarding(message)
-                if forward_data:
-                    for target in forward_to:
-                        try:
-                            if self._bluetooth_manager:
-                                success = await self._bluetooth_manager.send_data(target, forward_data)
-                                if success and self._connection_pool:
-                                    await self._connection_pool.record_message_sent(target, len(forward_data))
-                        except Exception as e:
-                            logger.warning(f"Failed to forward message to {target}: {e}")
+                if forward_data and self._bluetooth_manager:
+                    self._peer_relay.enqueue(forward_to, forward_data)
         except Exception as e:
-            logger.error(f"Error processing Bluetooth message from {address}: {e}", exc_info=True)
+            logger.error("Error processing Bluetooth message from %s: %s", address, e, exc_info=True)
             self._terminal.print_error(f"Error processing message: {e}")
     
     async def _on_gatt_message_received(self, client_address: str, data: bytes):
         """Handle message received via GATT server."""
         try:
-            connected = await self._bluetooth_manager.get_connected_devices() if self._bluetooth_manager else []
-            connected_addresses = [d.address for d in connected]
+            connected_addresses = self._bluetooth_manager.get_connected_addresses() if self._bluetooth_manager else []
             
             if not self._message_handler:
                 logger.warning("Message handler not available, cannot process GATT message")
@@ -577,18 +571,14 @@ class Application:
                 forward_data = await self._message_handler.prepare_for_forwarding(message)
                 if forward_data:
                     if self._bluetooth_manager:
-                        for target in forward_to:
-                            try:
-                                await self._bluetooth_manager.send_data(target, forward_data)
-                            except Exception as e:
-                                logger.warning(f"Failed to forward GATT message to {target}: {e}")
+                        self._peer_relay.enqueue(forward_to, forward_data)
                     if self._gatt_server:
                         try:
                             await self._gatt_server.send_notification(forward_data)
                         except Exception as e:
-                            logger.warning(f"Failed to send GATT notification: {e}")
+                            logger.warning("Failed to send GATT notification: %s", e)
         except Exception as e:
-            logger.error(f"Error processing GATT message from {client_address}: {e}", exc_info=True)
+            logger.error("Error processing GATT message from %s: %s", client_address, e, exc_info=True)
             self._terminal.print_error(f"Error processing GATT message: {e}")
     
     async def _on_app_device_found(self, device_info):
@@ -601,6 +591,8 @@ class Application:
         )
         
         # Auto-connect if we have available slots
+        if self._bluetooth_manager and self._bluetooth_manager.is_connected(device_info.address):
+            return
         if self._connection_pool and self._connection_pool.available_slots > 0:
             self._terminal.print_info(f"Auto-connecting to {device_info.address}...")
             try:
@@ -614,12 +606,14 @@ class Application:
         """Handle general device discovery."""
         # Only show in debug mode to avoid spam
         self._terminal.print_debug(
-            f"Device: {device_info.address} | {device_info.name or 'Unknown'}"
+            "Device: %s | %s", device_info.address, device_info.name or 'Unknown'
         )
+        self._terminal.notify_dashboard_dirty()
     
     async def _on_device_lost(self, device_info):
         """Handle device lost."""
-        self._terminal.print_debug(f"Device lost: {device_info.address}")
+        self._terminal.print_debug("Device lost: %s", device_info.address)
+        self._terminal.notify_dashboard_dirty()
     
     async def _on_message_received(self, message):
         """Handle received message for display."""
@@ -719,6 +713,10 @@ class Application:
         if self._discovery:
             await self._discovery.stop()
         
+        # Stop forwarding relays, letting cancelled writes unwind first
+        if self._peer_relay:
+            await self._peer_relay.stop_all()
+        
         # Stop Bluetooth manager
         if self._bluetooth_manager:
             await self._bluetooth_manager.stop()
@@ -743,9 +741,11 @@ async def main():
     """Main entry point."""
     app = Application()
     
-    # Set up signal handlers
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
+    
+    use_bounded_executor(loop, Config.resource.MAX_EXECUTOR_WORKERS)
     
+    # Set up signal handlers
     def signal_handler():
         print("\n[SIGNAL] Shutdown requested...")
         app.request_shutdown()
@@ -768,8 +768,7 @@ async def main():
         print("\n[INFO] Keyboard interrupt received")
     except Exception as e:
         print(f"[ERROR] Application error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Application error: {e}")
         sys.exit(1)
     finally:
         await app.stop()
@@ -778,4 +777,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    use_fast_event_loop()
     asyncio.run(main())
@@ -6,6 +6,7 @@ from .sanitizer import MessageSanitizer
 from .protocol import Message, MessageProtocol
 from .router import MeshRouter
 from .handler import MessageHandler
+from .relay import PeerRelay
 
 __all__ = [
     "MessageSanitizer",
@@ -13,4 +14,5 @@ __all__ = [
     "MessageProtocol",
     "MeshRouter",
     "MessageHandler",
+    "PeerRelay",
 ]
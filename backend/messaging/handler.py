@@ -44,6 +44,12 @@ class RateLimitTracker:
         self._device_counts: Dict[str, List[float]] = {}  # device_id -> timestamps
         self._global_timestamps: List[float] = []
         self._lock = asyncio.Lock()
+        
+        # Limits are fixed at startup; read them once instead of per message
+        self._enabled = Config.security.ENABLE_RATE_LIMITING
+        self._global_limit = Config.message.RATE_LIMIT_GLOBAL
+        self._device_limit = Config.message.RATE_LIMIT_PER_DEVICE
+        self._connection_limit = Config.message.RATE_LIMIT_PER_CONNECTION
     
     async def check_and_record(
         self,
@@ -56,7 +62,7 @@ class RateLimitTracker:
         Returns:
             Tuple of (allowed, limit_type, retry_after).
         """
-        if not Config.security.ENABLE_RATE_LIMITING:
+        if not self._enabled:
             return True, None, None
         
         current_time = time.time()
@@ -68,7 +74,7 @@ class RateLimitTracker:
             
             # Check global limit
             self._global_timestamps = [t for t in self._global_timestamps if t > cutoff]
-            if len(self._global_timestamps) >= Config.message.RATE_LIMIT_GLOBAL:
+            if len(self._global_timestamps) >= self._global_limit:
                 retry_after = self._global_timestamps[0] + window - current_time
                 return False, "global", retry_after
             
@@ -79,7 +85,7 @@ class RateLimitTracker:
                 self._device_counts[device_id] = [
                     t for t in self._device_counts[device_id] if t > cutoff
                 ]
-                if len(self._device_counts[device_id]) >= Config.message.RATE_LIMIT_PER_DEVICE:
+                if len(self._device_counts[device_id]) >= self._device_limit:
                     retry_after = self._device_counts[device_id][0] + window - current_time
                     return False, "device", retry_after
             
@@ -90,7 +96,7 @@ class RateLimitTracker:
                 self._connection_counts[connection_id] = [
                     t for t in self._connection_counts[connection_id] if t > cutoff
                 ]
-                if len(self._connection_counts[connection_id]) >= Config.message.RATE_LIMIT_PER_CONNECTION:
+                if len(self._connection_counts[connection_id]) >= self._connection_limit:
                     retry_after = self._connection_counts[connection_id][0] + window - current_time
                     return False, "connection", retry_after
             
@@ -116,21 +122,21 @@ class RateLimitTracker:
         async with self._lock:
             # Clean and count
             self._global_timestamps = [t for t in self._global_timestamps if t > cutoff]
-            global_remaining = Config.message.RATE_LIMIT_GLOBAL - len(self._global_timestamps)
+            global_remaining = self._global_limit - len(self._global_timestamps)
             
-            device_remaining = Config.message.RATE_LIMIT_PER_DEVICE
+            device_remaining = self._device_limit
             if device_id and device_id in self._device_counts:
                 self._device_counts[device_id] = [
                     t for t in self._device_counts[device_id] if t > cutoff
                 ]
-                device_remaining = Config.message.RATE_LIMIT_PER_DEVICE - len(self._device_counts[device_id])
+                device_remaining = self._device_limit - len(self._device_counts[device_id])
             
-            connection_remaining = Config.message.RATE_LIMIT_PER_CONNECTION
+            connection_remaining = self._connection_limit
             if connection_id and connection_id in self._connection_counts:
                 self._connection_counts[connection_id] = [
                     t for t in self._connection_counts[connection_id] if t > cutoff
                 ]
-                connection_remaining = Config.message.RATE_LIMIT_PER_CONNECTION - len(self._connection_counts[connection_id])
+                connection_remaining = self._connection_limit - len(self._connection_counts[connection_id])
             
             return {
                 "global": max(0, global_remaining),
@@ -154,6 +154,8 @@ class MessageProtocol:
     
     def __init__(self):
         self._sanitizer = MessageSanitizer()
+        self._max_message_size = Config.message.MAX_MESSAGE_SIZE
+        self._max_ttl = Config.message.MESSAGE_TTL
     
     def create_broadcast_message(
         self,
@@ -192,12 +194,12 @@ class MessageProtocol:
         
         # Validate size
         byte_size = message.get_byte_size()
-        if byte_size > Config.message.MAX_MESSAGE_SIZE:
+        if byte_size > self._max_message_size:
             raise MessageSizeError(
-                f"Message size ({byte_size} bytes) exceeds limit ({Config.message.MAX_MESSAGE_SIZE} bytes)",
+                f"Message size ({byte_size} bytes) exceeds limit ({self._max_message_size} bytes)",
                 message_id=message.message_id,
                 actual_size=byte_size,
-                max_size=Config.message.MAX_MESSAGE_SIZE,
+                max_size=self._max_message_size,
             )
         
         return message
@@ -264,8 +266,8 @@ class MessageProtocol:
         if message.ttl < 0:
             return False, "TTL cannot be negative"
         
-        if message.ttl > Config.message.MESSAGE_TTL:
-            return False, f"TTL exceeds maximum ({Config.message.MESSAGE_TTL})"
+        if message.ttl > self._max_ttl:
+            return False, f"TTL exceeds maximum ({self._max_ttl})"
         
         # Check timestamp
         current_time = time.time()
@@ -277,7 +279,7 @@ class MessageProtocol:
         
         # Check size
         byte_size = message.get_byte_size()
-        if byte_size > Config.message.MAX_MESSAGE_SIZE:
+        if byte_size > self._max_message_size:
             return False, f"Message size ({byte_size}) exceeds limit"
         
         return True, None
@@ -0,0 +1,92 @@
+"""
+Per-Peer Forward Relay.
+
+Queues outbound forwards per connected peer so a slow link only delays
+its own traffic, never message intake or other peers.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PeerRelay:
+    """
+    One bounded queue and relay task per connected peer.
+    
+    The receive path only enqueues; each peer's task drains its own queue
+    through the send callable. When a queue is full its oldest payload is
+    dropped, since newer mesh traffic supersedes it.
+    """
+    
+    DEFAULT_QUEUE_SIZE = 32
+    
+    def __init__(
+        self,
+        send: Callable[[str, bytes], Awaitable[bool]],
+        on_sent: Optional[Callable[[str, int], Awaitable[Any]]] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE
+    ):
+        """
+        Initialize the relay.
+        
+        Args:
+            send: Coroutine function writing bytes to a peer; returns success.
+            on_sent: Optional coroutine function called with (address, size)
+                after each successful send.
+            queue_size: Maximum pending payloads per peer.
+        """
+        self._send = send
+        self._on_sent = on_sent
+        self._queue_size = queue_size
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+    
+    def start(self, address: str) -> None:
+        """Create the queue and relay task for a connected peer."""
+        if address not in self._queues:
+            queue = asyncio.Queue(maxsize=self._queue_size)
+            self._queues[address] = queue
+            self._tasks[address] = asyncio.create_task(self._relay_loop(address, queue))
+    
+    async def stop(self, address: str) -> None:
+        """Drop a peer's queue and wait for its relay task to finish."""
+        self._queues.pop(address, None)
+        task = self._tasks.pop(address, None)
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def stop_all(self) -> None:
+        """Stop the relays of every peer."""
+        for address in list(self._tasks):
+            await self.stop(address)
+    
+    def enqueue(self, targets: List[str], data: bytes) -> None:
+        """Queue a payload for each target, dropping its oldest when full."""
+        for target in targets:
+            queue = self._queues.get(target)
+            if queue is None:
+                # Peer disconnected after the targets were chosen
+                continue
+            if queue.full():
+                queue.get_nowait()
+                logger.warning("Forward queue for %s full, dropping oldest message", target)
+            queue.put_nowait(data)
+    
+    async def _relay_loop(self, address: str, queue: asyncio.Queue) -> None:
+        """Send one peer's queued payloads in order."""
+        while True:
+            data = await queue.get()
+            try:
+                success = await self._send(address, data)
+                if success and self._on_sent:
+                    await self._on_sent(address, len(data))
+            except Exception as e:
+                logger.warning("Failed to forward message to %s: %s", address, e)
@@ -10,6 +10,7 @@ Provides security-focused sanitization to prevent:
 
 import re
 import html
+import sys
 import unicodedata
 from typing import Optional, Tuple
 
@@ -43,6 +44,9 @@ class MessageSanitizer:
         'Co',  # Private use
         'Cs',  # Surrogates
     }
+    _blocked_categories_re: Optional[re.Pattern] = None  # Built on first strict use
+    
+    MULTI_SPACE = re.compile(r' +')
     
     def __init__(self, strict_mode: bool = False):
         """
@@ -53,6 +57,14 @@ class MessageSanitizer:
         """
         self._strict_mode = strict_mode
         self._enabled = Config.security.ENABLE_INPUT_SANITIZATION
+        self._max_content_length = Config.message.MAX_CONTENT_LENGTH
+        self._max_message_size = Config.message.MAX_MESSAGE_SIZE
+        # Blocked patterns are matched case-insensitively as plain
+        # substrings; fold them into one regex so content is scanned once
+        blocked = Config.security.BLOCKED_PATTERNS
+        self._blocked_re = (
+            re.compile("|".join(re.escape(p.lower()) for p in blocked)) if blocked else None
+        )
     
     def sanitize(self, content: str) -> str:
         """
@@ -105,13 +117,13 @@ class MessageSanitizer:
             return False, "Message content cannot be empty"
         
         # Check length
-        if len(content) > Config.message.MAX_CONTENT_LENGTH:
-            return False, f"Message exceeds maximum length of {Config.message.MAX_CONTENT_LENGTH} characters"
+        if len(content) > self._max_content_length:
+            return False, f"Message exceeds maximum length of {self._max_content_length} characters"
         
         # Check byte size
         byte_size = len(content.encode('utf-8'))
-        if byte_size > Config.message.MAX_MESSAGE_SIZE:
-            return False, f"Message exceeds maximum size of {Config.message.MAX_MESSAGE_SIZE} bytes"
+        if byte_size > self._max_message_size:
+            return False, f"Message exceeds maximum size of {self._max_message_size} bytes"
         
         # Check for blocked patterns
         if self._enabled:
@@ -120,9 +132,8 @@ class MessageSanitizer:
                     return False, "Message contains blocked content"
         
         # Check for blocked words/patterns from config
-        for blocked in Config.security.BLOCKED_PATTERNS:
-            if blocked.lower() in content.lower():
-                return False, "Message contains blocked content"
+        if self._blocked_re is not None and self._blocked_re.search(content.lower()):
+            return False, "Message contains blocked content"
         
         return True, None
     
@@ -149,7 +160,7 @@ class MessageSanitizer:
         # Replace with space to prevent text concatenation issues
         content = self.CONTROL_CHARS.sub(' ', content)
         # Normalize multiple spaces
-        content = re.sub(r' +', ' ', content)
+        content = self.MULTI_SPACE.sub(' ', content)
         return content
     
     def _filter_dangerous_patterns(self, content: str) -> str:
@@ -167,23 +178,40 @@ class MessageSanitizer:
         content = content.strip()
         
         # Limit length
-        if len(content) > Config.message.MAX_CONTENT_LENGTH:
-            content = content[:Config.message.MAX_CONTENT_LENGTH]
+        if len(content) > self._max_content_length:
+            content = content[:self._max_content_length]
             # Try to break at word boundary
             last_space = content.rfind(' ')
-            if last_space > Config.message.MAX_CONTENT_LENGTH * 0.8:
+            if last_space > self._max_content_length * 0.8:
                 content = content[:last_space]
         
         return content
     
     def _filter_unicode_categories(self, content: str) -> str:
         """Filter blocked Unicode categories (strict mode)."""
-        result = []
-        for char in content:
-            category = unicodedata.category(char)
-            if category not in self.BLOCKED_UNICODE_CATEGORIES:
-                result.append(char)
-        return ''.join(result)
+        return self._get_blocked_categories_re().sub('', content)
+    
+    @classmethod
+    def _get_blocked_categories_re(cls) -> re.Pattern:
+        """
+        Compile the blocked categories into one character class.
+        
+        The code point ranges come from a single scan of the running
+        interpreter's unicodedata, so matching is identical to checking
+        each character's category, but done in one C-level pass.
+        """
+        if cls._blocked_categories_re is None:
+            ranges = []
+            start = None
+            for cp in range(sys.maxunicode + 2):
+                blocked = cp <= sys.maxunicode and unicodedata.category(chr(cp)) in cls.BLOCKED_UNICODE_CATEGORIES
+                if blocked and start is None:
+                    start = cp
+                elif not blocked and start is not None:
+                    ranges.append(f"\\U{start:08x}-\\U{cp - 1:08x}")
+                    start = None
+            cls._blocked_categories_re = re.compile(f"[{''.join(ranges)}]")
+        return cls._blocked_categories_re
     
     @staticmethod
     def sanitize_device_name(name: str) -> str:
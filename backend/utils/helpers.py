@@ -250,3 +250,46 @@ def retry_with_backoff(
         return wrapper
     
     return decorator
+
+
+def use_fast_event_loop() -> bool:
+    """
+    Make asyncio create uvloop event loops when uvloop is available.
+    
+    Call before asyncio.run(). uvloop is optional and not supported on
+    Windows; without it the default loop is kept.
+    
+    Returns:
+        True if uvloop was installed.
+    """
+    import sys
+    
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    import asyncio
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def use_bounded_executor(loop, max_workers: int) -> None:
+    """
+    Give a running loop a small, bounded default executor.
+    
+    The default executor only serves I/O-bound library calls, so
+    CPU-heavy work must not be sent there.
+    
+    Args:
+        loop: Event loop to configure.
+        max_workers: Maximum executor threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    loop.set_default_executor(ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="beacon-io"
+    ))
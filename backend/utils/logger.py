@@ -5,13 +5,28 @@ Provides consistent logging throughout the application.
 Simplified from the web version - no SocketIO or web-specific logging.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, TextIO
 from datetime import datetime
 
 from config import Config
 
+# JSON log encoder, chosen once: orjson when installed, else the stdlib
+try:
+    import orjson
+    
+    def _json_dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    import json
+    
+    def _json_dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, default=str)
+
 
 class SimpleFormatter(logging.Formatter):
     """
@@ -53,6 +68,40 @@ class SimpleFormatter(logging.Formatter):
         return result
 
 
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line, for LOG_FORMAT=json.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as a JSON line."""
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return _json_dumps(entry)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves all formatting to the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record as-is; the listener runs in this process."""
+        return record
+
+
+# Listener that drains the log queue; replaced on each setup_logging()
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+# Handler writing to the console, so the terminal UI can take its output
+_console_handler: Optional[logging.StreamHandler] = None
+
+
 class SecurityFilter(logging.Filter):
     """
     Filter to redact sensitive information from logs.
@@ -103,7 +152,12 @@ class ContextLogger(logging.LoggerAdapter):
 def setup_logging() -> None:
     """
     Set up logging configuration for the application.
+    
+    Records are handed to a background listener thread through a queue,
+    so formatting and console/file writes never block the event loop.
     """
+    global _queue_listener, _console_handler
+    
     # Get log level from config
     log_level = getattr(logging, Config.log.LOG_LEVEL.upper(), logging.INFO)
     
@@ -113,21 +167,28 @@ def setup_logging() -> None:
     
     # Remove existing handlers
     root_logger.handlers.clear()
+    if _queue_listener:
+        _queue_listener.stop()
+    handlers = []
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     
-    # Set formatter
+    # Set formatter; one instance is shared by every handler that can use it
     use_colors = Config.terminal.COLOR_OUTPUT if hasattr(Config, 'terminal') else True
-    formatter = SimpleFormatter(use_colors=use_colors)
+    if Config.log.LOG_FORMAT.lower() == "json":
+        formatter = file_formatter = JsonFormatter()
+    else:
+        formatter = SimpleFormatter(use_colors=use_colors)
+        file_formatter = formatter if not formatter.use_colors else SimpleFormatter(use_colors=False)
     console_handler.setFormatter(formatter)
     
     # Add security filter
     console_handler.addFilter(SecurityFilter())
     
-    # Add handler to root logger
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
+    _console_handler = console_handler
     
     # Add file handler if configured (optional - disabled by default for no persistence)
     # NOTE: File logging is the ONLY persistence mechanism in the application.
@@ -135,9 +196,17 @@ def setup_logging() -> None:
     if Config.log.LOG_FILE:
         file_handler = logging.FileHandler(Config.log.LOG_FILE)
         file_handler.setLevel(log_level)
-        file_handler.setFormatter(SimpleFormatter(use_colors=False))
+        file_handler.setFormatter(file_formatter)
         file_handler.addFilter(SecurityFilter())
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Route everything through the queue to the real handlers
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_DeferredQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Set level for third-party loggers to reduce noise
     logging.getLogger('bleak').setLevel(logging.ERROR)  # Only show errors
@@ -170,6 +239,30 @@ def setup_logging() -> None:
     logging.getLogger('dbus-fast.message_bus').addFilter(error_filter)  # Alternative name
 
 
+def _stop_queue_listener() -> None:
+    """Flush queued records at interpreter exit."""
+    if _queue_listener:
+        _queue_listener.stop()
+
+
+atexit.register(_stop_queue_listener)
+
+
+def set_console_stream(stream: TextIO) -> Optional[TextIO]:
+    """
+    Send console log output to another stream.
+    
+    Args:
+        stream: File-like object to write formatted records to.
+    
+    Returns:
+        The previous stream, or None if logging is not set up.
+    """
+    if _console_handler is None:
+        return None
+    return _console_handler.setStream(stream)
+
+
 def get_logger(name: str, context: Dict[str, Any] = None) -> ContextLogger:
     """
     Get a logger with optional context.
@@ -112,6 +112,87 @@ class TestBluetoothManager:
         """Test connection count property."""
         count = await manager.get_connection_count()
         assert count == 0
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_skips_failing_peers(self, manager):
+        """Test that peers with repeated send failures are skipped."""
+        from bluetooth.manager import PeerConnection
+        
+        for address in ("AA:AA", "BB:BB"):
+            info = DeviceInfo(address=address, state=ConnectionState.CONNECTED)
+            manager._connections[address] = PeerConnection(device_info=info)
+        manager._connections["BB:BB"].consecutive_failures = (
+            BluetoothConstants.MAX_CONSECUTIVE_SEND_FAILURES
+        )
+        
+        manager.send_message = AsyncMock(return_value=True)
+        sent = await manager.broadcast_message({"type": "heartbeat"})
+        
+        assert sent == 1
+        manager.send_message.assert_awaited_once_with("AA:AA", {"type": "heartbeat"})
+    
+    @pytest.mark.asyncio
+    async def test_repeated_send_failures_disconnect_peer(self, manager):
+        """Test that a peer reaching the failure limit is disconnected."""
+        from bluetooth.manager import PeerConnection
+        
+        info = DeviceInfo(address="AA:AA", state=ConnectionState.CONNECTED)
+        conn = PeerConnection(device_info=info)
+        manager._connections["AA:AA"] = conn
+        
+        for _ in range(BluetoothConstants.MAX_CONSECUTIVE_SEND_FAILURES - 1):
+            await manager._record_send_failure("AA:AA", conn)
+        assert "AA:AA" not in manager._pending_disconnects
+        
+        await manager._record_send_failure("AA:AA", conn)
+        await manager._pending_disconnects["AA:AA"]
+        
+        assert "AA:AA" not in manager._connections
+    
+    @pytest.mark.asyncio
+    async def test_connected_addresses_cache_invalidation(self, manager):
+        """Test that the cached address list follows disconnects."""
+        from bluetooth.manager import PeerConnection
+        
+        info = DeviceInfo(address="AA:AA", state=ConnectionState.CONNECTED)
+        manager._connections["AA:AA"] = PeerConnection(device_info=info)
+        assert manager.get_connected_addresses() == ["AA:AA"]
+        
+        await manager.disconnect_device("AA:AA")
+        
+        assert manager.get_connected_addresses() == []
+    
+    @pytest.mark.asyncio
+    async def test_scheduled_disconnect_is_tracked_once(self, manager):
+        """Test that repeated send timeouts share one pending disconnect."""
+        from bluetooth.manager import PeerConnection
+        
+        info = DeviceInfo(address="AA:AA", state=ConnectionState.CONNECTED)
+        manager._connections["AA:AA"] = PeerConnection(device_info=info)
+        
+        manager._schedule_disconnect("AA:AA")
+        task = manager._pending_disconnects["AA:AA"]
+        manager._schedule_disconnect("AA:AA")
+        assert manager._pending_disconnects["AA:AA"] is task
+        
+        await task
+        await asyncio.sleep(0)
+        
+        assert "AA:AA" not in manager._pending_disconnects
+        assert "AA:AA" not in manager._connections
+    
+    @pytest.mark.asyncio
+    async def test_stale_connection_cleanup(self, manager):
+        """Test that peers past the heartbeat timeout are disconnected."""
+        from bluetooth.manager import PeerConnection
+        
+        info = DeviceInfo(address="AA:AA", state=ConnectionState.CONNECTED)
+        info.last_heartbeat = time.time() - 3600
+        manager._connections["AA:AA"] = PeerConnection(device_info=info)
+        
+        await manager._cleanup_stale_connections()
+        
+        assert "AA:AA" not in manager._connections
 
 
 class TestDeviceDiscovery:
@@ -157,6 +238,46 @@ class TestDeviceDiscovery:
         await discovery.clear_cache()
         devices = await discovery.get_all_devices()
         assert devices == []
+    
+    def test_cache_evicts_least_recently_seen(self, discovery):
+        """Test that the discovery cache is capped by last sighting."""
+        discovery._max_devices = 2
+        for address in ("AA:AA", "BB:BB"):
+            discovery._discovered_devices[address] = DeviceInfo(address=address)
+        discovery._app_devices.add("BB:BB")
+        discovery._discovered_devices.move_to_end("AA:AA")
+        
+        discovery._discovered_devices["CC:CC"] = DeviceInfo(address="CC:CC")
+        discovery._evict_oldest_devices()
+        
+        assert list(discovery._discovered_devices) == ["AA:AA", "CC:CC"]
+        assert "BB:BB" not in discovery._app_devices
+    
+    @pytest.mark.asyncio
+    async def test_overlapping_scans_stop_own_scanners(self, discovery):
+        """Test that each of two overlapping scans stops its own scanner."""
+        scanners = []
+        
+        def make_scanner(detection_callback=None):
+            scanner = MagicMock()
+            scanner.start = AsyncMock()
+            scanner.stop = AsyncMock()
+            scanners.append(scanner)
+            return scanner
+        
+        async def delayed_scan():
+            await asyncio.sleep(0.01)
+            return await discovery.scan_once(timeout=0.05)
+        
+        with patch("bluetooth.discovery.BleakScanner", side_effect=make_scanner):
+            await asyncio.gather(discovery.scan_once(timeout=0.05), delayed_scan())
+            await discovery._wait_scanner_stopped()
+        
+        assert len(scanners) == 2
+        for scanner in scanners:
+            scanner.stop.assert_awaited_once()
+        assert discovery._scanner is None
+        assert not discovery._scanner_stop_tasks
 
 
 class TestMessageHandler:
@@ -380,5 +501,33 @@ class TestMessageProtocol:
         assert restored.message_id == original.message_id
 
 
+class TestTerminalUI:
+    """Tests for the terminal UI."""
+    
+    @pytest.mark.asyncio
+    async def test_log_output_invalidates_dashboard(self):
+        """Test that console log lines force a full dashboard repaint."""
+        import logging
+        from cli.terminal import TerminalUI
+        from utils.logger import setup_logging, set_console_stream
+        
+        setup_logging()
+        ui = TerminalUI()
+        ui._prev_dashboard_lines = ["stale frame"]
+        ui._capture_console_logging()
+        try:
+            logging.getLogger("test").warning("scrolls the screen")
+            # The record is written from the logging listener thread
+            for _ in range(100):
+                if not ui._prev_dashboard_lines:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            set_console_stream(ui._prev_log_stream)
+        
+        assert ui._prev_dashboard_lines == []
+        assert ui._dashboard_dirty.is_set()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 from messaging.sanitizer import MessageSanitizer
 from messaging.protocol import Message, MessageProtocol, MessageType
 from messaging.router import MeshRouter
+from messaging.relay import PeerRelay
 
 
 class TestMessageSanitizer:
@@ -166,6 +167,30 @@ class TestMessage:
         assert restored.sender_id == msg.sender_id
         assert restored.content == msg.content
     
+    def test_wire_bytes_independent_of_orjson(self, monkeypatch):
+        """Test that wire bytes and sizes do not depend on orjson."""
+        import importlib.util
+        import messaging.protocol as protocol
+        
+        fields = dict(
+            message_id="id-1",
+            sender_id="device-1",
+            content="héllo wörld ✓",
+            timestamp=1700000000.5,
+        )
+        
+        # Load a private copy of the module with orjson unavailable
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        spec = importlib.util.spec_from_file_location("_protocol_stdlib", protocol.__file__)
+        stdlib_protocol = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(stdlib_protocol)
+        
+        msg = Message(**fields)
+        stdlib_msg = stdlib_protocol.Message(**fields)
+        
+        assert msg.to_bytes() == stdlib_msg.to_bytes()
+        assert msg.get_byte_size() == stdlib_msg.get_byte_size()
+    
     def test_decrement_ttl(self):
         """Test TTL decrement."""
         msg = Message(ttl=3)
@@ -357,5 +382,64 @@ class TestMeshRouter:
         assert self.router.get_cache_size() == 0
 
 
+class TestPeerRelay:
+    """Tests for PeerRelay class."""
+    
+    @pytest.mark.asyncio
+    async def test_enqueue_drops_oldest_when_full(self):
+        """Test that a full queue drops its oldest payload."""
+        release = asyncio.Event()
+        sent = []
+        
+        async def send(address, data):
+            await release.wait()
+            sent.append(data)
+            return True
+        
+        relay = PeerRelay(send, queue_size=2)
+        relay.start("device-1")
+        
+        # Let the relay take the first payload and block in send
+        relay.enqueue(["device-1"], b"first")
+        await asyncio.sleep(0)
+        relay.enqueue(["device-1", "device-2"], b"second")
+        relay.enqueue(["device-1"], b"third")
+        relay.enqueue(["device-1"], b"fourth")
+        
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await relay.stop_all()
+        
+        assert sent == [b"first", b"third", b"fourth"]
+    
+    @pytest.mark.asyncio
+    async def test_stop_awaits_relay_task(self):
+        """Test that stopping a peer cancels and awaits its relay."""
+        send_started = asyncio.Event()
+        
+        async def send(address, data):
+            send_started.set()
+            await asyncio.sleep(3600)
+            return True
+        
+        on_sent = AsyncMock()
+        relay = PeerRelay(send, on_sent=on_sent)
+        relay.start("device-1")
+        task = relay._tasks["device-1"]
+        
+        relay.enqueue(["device-1"], b"payload")
+        await send_started.wait()
+        await relay.stop("device-1")
+        
+        assert task.done()
+        assert "device-1" not in relay._tasks
+        on_sent.assert_not_called()
+        
+        # Forwards to a stopped peer are ignored
+        relay.enqueue(["device-1"], b"late")
+        assert "device-1" not in relay._queues
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])